@@ -0,0 +1,131 @@
+"""
+Per-City Candidate Cache
+Keeps each city's places and their BERT embedding matrix in-process
+"""
+import asyncio
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import numpy as np
+from fastapi.concurrency import run_in_threadpool
+
+from configs.settings import settings
+from src.models import Place, PLACE_PROJECTION
+from src.routing_kernels import haversine_matrix
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CityData:
+    """Cached candidates of a city"""
+    places: List[Place]  # Top rated first
+    embeddings: np.ndarray  # (n_places, 768), float32, C-contiguous, row i ↔ places[i]
+    distance_matrix: Optional[np.ndarray] = None  # (n_places, n_places) Haversine km
+
+
+class CityCache:
+    """
+    LRU cache of CityData keyed on city name
+    
+    A miss loads the places with the async Motor cursor and encodes the
+    missing BERT embeddings in the threadpool; hits are served from memory.
+    """
+    
+    def __init__(self, maxsize: int = 32):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, CityData]" = OrderedDict()
+        self._locks: Dict[str, asyncio.Lock] = {}
+    
+    async def get(self, city: str, db, recommender) -> CityData:
+        """
+        Get cached data for a city, loading it on a miss
+        
+        Args:
+            city: City name
+            db: Async (Motor) database
+            recommender: Shared HybridRecommender (owns the BERT model)
+        
+        Returns:
+            CityData (with empty places if the city has none)
+        """
+        entry = self._entries.get(city)
+        if entry is not None:
+            self._entries.move_to_end(city)
+            return entry
+        
+        lock = self._locks.setdefault(city, asyncio.Lock())
+        async with lock:
+            # Another request may have loaded it while we waited
+            entry = self._entries.get(city)
+            if entry is not None:
+                return entry
+            
+            entry = await self._load(city, db, recommender)
+            
+            # Don't cache empty cities so newly imported data shows up
+            if entry.places:
+                self._entries[city] = entry
+                while len(self._entries) > self.maxsize:
+                    evicted, _ = self._entries.popitem(last=False)
+                    logger.info(f"City cache evicted {evicted}")
+        
+        return entry
+    
+    def invalidate(self, city: Optional[str] = None) -> int:
+        """
+        Drop one city (or all cities if None) from the cache
+        
+        Returns:
+            Number of evicted entries
+        """
+        if city is None:
+            count = len(self._entries)
+            self._entries.clear()
+            return count
+        
+        return 1 if self._entries.pop(city, None) is not None else 0
+    
+    async def _load(self, city: str, db, recommender) -> CityData:
+        """Load places from MongoDB and build their embedding matrix"""
+        cursor = (
+            db["places"]
+            .find({"city": city}, projection=PLACE_PROJECTION)
+            .sort("rating", -1)
+            .limit(settings.MAX_PLACES_PER_REQUEST)
+        )
+        docs = await cursor.to_list(length=settings.MAX_PLACES_PER_REQUEST)
+        places = Place.from_dicts(docs)
+        
+        if not places:
+            return CityData(
+                places=[],
+                embeddings=np.zeros((0, 768), dtype=np.float32)
+            )
+        
+        def encode() -> np.ndarray:
+            content_filter = recommender.content_filter
+            content_filter.precompute_embeddings(places)
+            return content_filter.get_embedding_matrix(places)
+        
+        def distances() -> np.ndarray:
+            return haversine_matrix(
+                np.array([p.latitude for p in places], dtype=np.float64),
+                np.array([p.longitude for p in places], dtype=np.float64)
+            )
+        
+        embeddings = await run_in_threadpool(encode)
+        distance_matrix = await run_in_threadpool(distances)
+        
+        logger.info(f"City cache loaded {len(places)} places for {city}")
+        return CityData(
+            places=places,
+            embeddings=embeddings,
+            distance_matrix=distance_matrix
+        )
+
+
+# Process-wide instance
+city_cache = CityCache(maxsize=settings.CITY_CACHE_SIZE)
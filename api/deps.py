@@ -0,0 +1,91 @@
+"""
+Shared FastAPI Dependencies
+Process-wide singletons reused across requests
+"""
+import secrets
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
+
+from fastapi import Header, HTTPException, status
+
+from configs.settings import get_settings
+
+if TYPE_CHECKING:
+    from motor.motor_asyncio import AsyncIOMotorDatabase
+    from src.database import MongoDBHandler
+    from src.hybrid_recommender import HybridRecommender
+    from src.smart_itinerary_planner import SmartItineraryPlanner
+
+
+def get_db_handler() -> "MongoDBHandler":
+    """
+    Get the shared MongoDB handler
+    
+    Delegates to src.database.get_db_handler, so the API and the library
+    modules share one MongoClient (and its connection pool) per process.
+    """
+    # Imported on first call (primed once at startup by the app lifespan)
+    from src.database import get_db_handler as get_shared_db_handler
+    
+    return get_shared_db_handler()
+
+
+@lru_cache(maxsize=1)
+def get_async_db() -> "AsyncIOMotorDatabase":
+    """
+    Get the shared async (Motor) database for request-path queries
+    
+    Cursor I/O is awaited on the event loop instead of blocking it.
+    """
+    from motor.motor_asyncio import AsyncIOMotorClient
+    from src.config import config
+    
+    settings = get_settings()
+    client = AsyncIOMotorClient(
+        config.MONGODB_URI,
+        maxPoolSize=settings.MONGODB_MAX_POOL_SIZE,
+        minPoolSize=settings.MONGODB_MIN_POOL_SIZE,
+        maxIdleTimeMS=settings.MONGODB_MAX_IDLE_TIME_MS
+    )
+    return client[config.MONGODB_DATABASE]
+
+
+@lru_cache(maxsize=1)
+def get_recommender() -> "HybridRecommender":
+    """
+    Get the shared hybrid recommender
+    
+    BERT model, embedding cache and SVD model are loaded once per worker.
+    """
+    from src.hybrid_recommender import HybridRecommender
+    
+    return HybridRecommender()
+
+
+def require_admin_key(x_api_key: Optional[str] = Header(None)) -> None:
+    """
+    Guard admin endpoints with the configured API key
+    
+    With ENABLE_API_KEY_AUTH the X-API-Key header must match API_KEY;
+    without it admin endpoints are only served in DEBUG.
+    """
+    settings = get_settings()
+    if settings.ENABLE_API_KEY_AUTH and settings.API_KEY:
+        if x_api_key is None or not secrets.compare_digest(x_api_key, settings.API_KEY):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid or missing API key"
+            )
+    elif not settings.DEBUG:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin endpoints require ENABLE_API_KEY_AUTH and API_KEY (or DEBUG)"
+        )
+
+
+@lru_cache(maxsize=1)
+def get_itinerary_planner() -> "SmartItineraryPlanner":
+    """Get the shared itinerary planner (reuses DB handler and recommender)"""
+    from src.smart_itinerary_planner import SmartItineraryPlanner
+    
+    return SmartItineraryPlanner(get_db_handler(), recommender=get_recommender())
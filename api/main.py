@@ -8,14 +8,18 @@ from pathlib import Path
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 import time
 import logging
 
 from configs.settings import settings
-from api.routes import itinerary, recommendation
+from api.routes import itinerary, recommendation, admin
+from api.deps import get_async_db, get_db_handler, get_itinerary_planner, get_recommender
+from api.schemas.response import build_schemas
 
 # Configure logging
 logging.basicConfig(
@@ -24,6 +28,32 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Load heavy modules and models once at worker boot
+    
+    Builds the Pydantic schemas and primes the cached dependencies (MongoDB
+    clients, BERT/SVD recommender, itinerary planner) so requests never pay
+    import, schema-build or model-load costs.
+    """
+    start_ns = time.perf_counter_ns()
+    
+    build_schemas()
+    recommender = get_recommender()
+    recommender.content_filter._load_model()
+    get_itinerary_planner()
+    get_async_db()
+    
+    logger.info(f"Startup completed in {(time.perf_counter_ns() - start_ns) / 1e9:.1f}s")
+    
+    yield
+    
+    get_db_handler().disconnect()
+    get_async_db().client.close()
+
+
 # Create FastAPI app
 app = FastAPI(
     title=settings.APP_NAME,
@@ -56,9 +86,15 @@ AI-powered travel itinerary generation using advanced machine learning algorithm
     """,
     docs_url="/docs",
     redoc_url="/redoc",
-    openapi_url="/openapi.json"
+    openapi_url="/openapi.json",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
+# Compress large JSON payloads (itineraries, recommendation lists)
+# Added before CORS so CORS stays outermost and preflights skip compression
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -71,15 +107,15 @@ app.add_middleware(
 # Add request timing middleware
 @app.middleware("http")
 async def add_process_time_header(request: Request, call_next):
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     response = await call_next(request)
-    process_time = time.time() - start_time
-    response.headers["X-Process-Time"] = str(round(process_time * 1000, 2))
+    response.headers["X-Process-Time"] = str((time.perf_counter_ns() - start_ns) // 1_000_000)
     return response
 
 # Include routers
 app.include_router(itinerary.router, prefix="/api/v1", tags=["Itinerary"])
 app.include_router(recommendation.router, prefix="/api/v1", tags=["Recommendations"])
+app.include_router(admin.router, prefix="/api/v1", tags=["Admin"])
 
 # Root endpoint
 @app.get("/", tags=["Root"])
@@ -98,17 +134,38 @@ async def root():
         }
     }
 
+class _HealthCache:
+    """Last successful MongoDB ping, reused by probes within the TTL"""
+    
+    def __init__(self, ttl: float = 1.0):
+        self.ttl = ttl
+        self.last_ok_ts = float("-inf")
+    
+    def is_fresh(self) -> bool:
+        return time.monotonic() - self.last_ok_ts < self.ttl
+    
+    def mark_ok(self):
+        self.last_ok_ts = time.monotonic()
+
+
+# Process-wide instance
+_health_cache = _HealthCache(ttl=1.0)
+
+
 # Health check endpoint
 @app.get("/health", tags=["Health"])
 async def health_check():
     """
     Health check endpoint for monitoring
+    
+    Pings MongoDB through the shared async client; a successful ping is
+    reused for ~1s so high-frequency probes don't hit the database.
     """
     try:
-        # Test MongoDB connection
-        from src.database import MongoDBHandler
-        db = MongoDBHandler()
-        db.client.server_info()  # Will raise exception if can't connect
+        if not _health_cache.is_fresh():
+            # Test MongoDB connection (raises if can't connect)
+            await get_async_db().client.admin.command("ping")
+            _health_cache.mark_ok()
         
         return {
             "status": "healthy",
@@ -118,7 +175,7 @@ async def health_check():
         }
     except Exception as e:
         logger.error(f"Health check failed: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=503,
             content={
                 "status": "unhealthy",
@@ -130,8 +187,12 @@ async def health_check():
 # Global exception handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
-    logger.error(f"Global exception: {exc}", exc_info=True)
-    return JSONResponse(
+    # Stack formatting is costly under error storms, only do it in debug
+    if settings.DEBUG:
+        logger.exception("Global exception")
+    else:
+        logger.error("Global exception: %r", exc)
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "InternalServerError",
@@ -141,10 +202,17 @@ async def global_exception_handler(request: Request, exc: Exception):
     )
 
 if __name__ == "__main__":
+    import os
     import uvicorn
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=8000,
+        # uvicorn ignores workers when reload is on
+        workers=1 if settings.DEBUG else (settings.WORKERS or os.cpu_count()),
+        loop="uvloop",
+        http="httptools",
+        limit_concurrency=settings.LIMIT_CONCURRENCY,
+        timeout_keep_alive=settings.TIMEOUT_KEEP_ALIVE,
         reload=settings.DEBUG
     )
@@ -0,0 +1,82 @@
+"""
+Itinerary Response Cache
+Content-addressed TTL cache of full responses keyed on a request hash
+"""
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+import orjson
+from pydantic import BaseModel
+
+from configs.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """
+    LRU + TTL cache of API responses
+    
+    Keys are BLAKE2b hashes of the normalized request JSON, so identical
+    requests map to the same entry regardless of field order.
+    """
+    
+    def __init__(self, maxsize: int = 256, ttl_seconds: int = 3600):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        # key -> (expires_at, city, response)
+        self._entries: "OrderedDict[str, Tuple[float, str, Any]]" = OrderedDict()
+    
+    @staticmethod
+    def make_key(request: BaseModel) -> str:
+        """Hash the normalized request body"""
+        payload = orjson.dumps(request.model_dump(mode="json"), option=orjson.OPT_SORT_KEYS)
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Get a cached response (None on miss or expiry)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        expires_at, _, response = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        
+        self._entries.move_to_end(key)
+        return response
+    
+    def set(self, key: str, city: str, response: Any) -> None:
+        """Store a response"""
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, city, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+    
+    def invalidate(self, city: Optional[str] = None) -> int:
+        """
+        Drop cached responses for a city (or all if None)
+        
+        Returns:
+            Number of evicted entries
+        """
+        if city is None:
+            count = len(self._entries)
+            self._entries.clear()
+            return count
+        
+        keys = [key for key, (_, entry_city, _) in self._entries.items() if entry_city == city]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+
+# Process-wide instance
+itinerary_cache = ResponseCache(
+    maxsize=settings.ITINERARY_CACHE_SIZE,
+    ttl_seconds=settings.ITINERARY_CACHE_TTL_SECONDS
+)
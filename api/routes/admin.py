@@ -0,0 +1,39 @@
+"""
+Admin Endpoints
+"""
+from typing import Optional
+from fastapi import APIRouter, Depends, Query
+from api.city_cache import city_cache
+from api.deps import require_admin_key
+from api.response_cache import itinerary_cache
+import logging
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(dependencies=[Depends(require_admin_key)])
+
+
+@router.post(
+    "/admin/reload",
+    summary="Reload City Cache",
+    description=(
+        "Drop cached places/embeddings and itineraries for a city (or all cities) so they are rebuilt "
+        "on the next request. Requires the X-API-Key header (API key auth enabled) or DEBUG."
+    )
+)
+async def reload_city_cache(
+    city: Optional[str] = Query(None, description="City to reload (all cities if omitted)")
+):
+    """Invalidate the per-city candidate cache and cached itineraries"""
+    evicted = city_cache.invalidate(city)
+    evicted_itineraries = itinerary_cache.invalidate(city)
+    logger.info(
+        f"City cache reload requested for {city or 'all cities'}: "
+        f"{evicted} cities, {evicted_itineraries} itineraries evicted"
+    )
+    
+    return {
+        "city": city,
+        "evicted": evicted,
+        "evicted_itineraries": evicted_itineraries
+    }
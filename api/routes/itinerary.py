@@ -1,7 +1,13 @@
 """
 Itinerary Generation Endpoints
 """
-from fastapi import APIRouter, HTTPException, status
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from api.city_cache import city_cache
+from configs.settings import settings
+from api.deps import get_async_db, get_itinerary_planner
+from api.response_cache import itinerary_cache
 from api.schemas.request import GenerateItineraryRequest
 from api.schemas.response import ItineraryResponse, ErrorResponse
 import time
@@ -36,7 +42,12 @@ Generate a complete personalized travel itinerary with scheduled places, transpo
 - Warm run (cached): ~5-10 seconds
     """
 )
-async def generate_itinerary(request: GenerateItineraryRequest):
+async def generate_itinerary(
+    request: GenerateItineraryRequest,
+    planner=Depends(get_itinerary_planner),
+    db=Depends(get_async_db),
+    cache_control: Optional[str] = Header(None)
+):
     """
     Generate a personalized travel itinerary
     
@@ -77,27 +88,43 @@ async def generate_itinerary(request: GenerateItineraryRequest):
     }
     ```
     """
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     
     try:
         logger.info(f"Generating itinerary for {request.city}, {request.num_days} days")
         
-        # Import here to avoid slow startup
-        from src.database import MongoDBHandler
-        from src.smart_itinerary_planner import SmartItineraryPlanner
-        
-        # Initialize
-        db = MongoDBHandler()
-        planner = SmartItineraryPlanner(db)
+        # Identical requests are served from the response cache
+        # (bypass with "Cache-Control: no-cache")
+        cache_key = itinerary_cache.make_key(request)
+        use_cache = not (cache_control and "no-cache" in cache_control.lower())
+        if use_cache:
+            cached = itinerary_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Itinerary cache hit for {request.city} ({cache_key})")
+                # Report this request's time, not the one that generated it
+                return cached.model_copy(update={
+                    "processing_time_ms": (time.perf_counter_ns() - start_ns) // 1_000_000
+                })
         
         # Convert request to UserPreference
         user_pref = request.to_user_preference()
         
-        # Generate itinerary
-        tour = planner.generate_itinerary(
+        # Candidate places (cached per city, with their BERT embeddings)
+        city_data = await city_cache.get(request.city, db, planner.recommender)
+        if not city_data.places:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"No places found for {request.city}. Please check city name or try another destination."
+            )
+        
+        # Generate itinerary in the threadpool so the event loop stays free
+        # (trip length is carried by user_pref.trip_duration_days)
+        tour = await run_in_threadpool(
+            planner.generate_itinerary,
             user_pref=user_pref,
             start_date=request.start_date,
-            num_days=request.num_days
+            places=city_data.places,
+            distance_matrix=city_data.distance_matrix
         )
         
         if not tour or tour.get_total_places() == 0:
@@ -107,7 +134,7 @@ async def generate_itinerary(request: GenerateItineraryRequest):
             )
         
         # Calculate processing time
-        processing_time_ms = int((time.time() - start_time) * 1000)
+        processing_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
         
         # Convert to response
         response = ItineraryResponse.from_tour_itinerary(
@@ -116,6 +143,8 @@ async def generate_itinerary(request: GenerateItineraryRequest):
             processing_time_ms=processing_time_ms
         )
         
+        itinerary_cache.set(cache_key, request.city, response)
+        
         logger.info(
             f"Itinerary generated successfully: {response.total_places} places, "
             f"${response.total_cost_usd:.2f}, {processing_time_ms}ms"
@@ -126,7 +155,7 @@ async def generate_itinerary(request: GenerateItineraryRequest):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error generating itinerary: {e}", exc_info=True)
+        logger.error(f"Error generating itinerary: {e}", exc_info=settings.DEBUG)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to generate itinerary: {str(e)}"
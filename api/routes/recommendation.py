@@ -1,9 +1,18 @@
 """
 Recommendation Endpoints (without scheduling)
 """
-from fastapi import APIRouter, HTTPException, status
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from api.city_cache import city_cache
+from configs.settings import settings
+from api.deps import get_async_db, get_recommender
 from api.schemas.request import GetRecommendationsRequest
-from api.schemas.response import RecommendationsResponse, RecommendationItem, ErrorResponse
+from api.schemas.response import RecommendationsResponse, RecommendationItem, ErrorResponse, RECO_LIST_ADAPTER
+from src.models import UserPreference
+import numpy as np
+import orjson
 import time
 import logging
 
@@ -11,6 +20,14 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def _ndjson_lines(recommendations):
+    """Yield one JSON line per recommendation"""
+    for item in RECO_LIST_ADAPTER.dump_python(recommendations):
+        yield orjson.dumps(item) + b"\n"
+
 
 @router.post(
     "/recommendations",
@@ -26,9 +43,17 @@ Useful for:
 - Showing recommendations to users for selection
 - Pre-filtering before itinerary generation
 - Exploring places in a city
+
+Send `Accept: application/x-ndjson` to stream one recommendation per line
+(totals are returned in `X-Total-Candidates` / `X-Process-Time` headers).
     """
 )
-async def get_recommendations(request: GetRecommendationsRequest):
+async def get_recommendations(
+    request: GetRecommendationsRequest,
+    db=Depends(get_async_db),
+    recommender=Depends(get_recommender),
+    accept: Optional[str] = Header(None)
+):
     """
     Get Top-K place recommendations for a city
     
@@ -59,32 +84,14 @@ async def get_recommendations(request: GetRecommendationsRequest):
     }
     ```
     """
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     
     try:
         logger.info(f"Getting recommendations for {request.city}, k={request.num_recommendations}")
         
-        # Import here
-        from src.database import MongoDBHandler
-        from src.hybrid_recommender import HybridRecommender
-        from src.models import UserPreference, Place
-        
-        # Initialize
-        db = MongoDBHandler()
-        recommender = HybridRecommender()
-        
-        # Load places
-        places_collection = db.get_collection("places")
-        places_cursor = places_collection.find({"city": request.city}).sort("rating", -1)
-        
-        places = []
-        for doc in places_cursor:
-            try:
-                place = Place.from_dict(doc)
-                places.append(place)
-            except Exception as e:
-                logger.warning(f"Failed to parse place: {e}")
-                continue
+        # Load places (cached per city, with their BERT embeddings)
+        city_data = await city_cache.get(request.city, db, recommender)
+        places = city_data.places
         
         if len(places) == 0:
             raise HTTPException(
@@ -103,44 +110,62 @@ async def get_recommendations(request: GetRecommendationsRequest):
             selected_places=request.selected_place_ids or []
         )
         
-        # Get recommendations
-        scored_places = recommender.get_top_recommendations(
+        # Resolve selected IDs to the cached Place objects
+        selected_ids = set(request.selected_place_ids or [])
+        selected_places = [p for p in places if p.place_id in selected_ids]
+        
+        # Get recommendations (BERT/SVD scoring is CPU-bound, run in threadpool)
+        scored_places = await run_in_threadpool(
+            recommender.get_top_recommendations,
             user_pref=user_pref,
             candidate_places=places,
-            selected_places=request.selected_place_ids or [],
-            k=request.num_recommendations
+            selected_places=selected_places,
+            k=request.num_recommendations,
+            candidate_embeddings=city_data.embeddings
         )
         
-        # Convert to response
-        recommendations = []
-        for place, score in scored_places:
-            recommendations.append(RecommendationItem(
+        # Convert to response (bulk rounding, no per-item validation)
+        n = len(scored_places)
+        scores = np.round(np.fromiter((score for _, score in scored_places), dtype=np.float64, count=n), 4)
+        prices = np.round(np.fromiter((place.avg_price for place, _ in scored_places), dtype=np.float64, count=n), 2)
+        
+        recommendations = [
+            RecommendationItem.model_construct(
                 place_id=place.place_id,
                 name=place.name,
                 rating=place.rating,
                 price_level=place.price_level,
-                types=place.types[:3] if hasattr(place, 'types') else [],
-                score=round(score, 4),
-                avg_price_usd=round(place.avg_price_usd, 2)
-            ))
+                types=place.types[:3],
+                score=score,
+                avg_price_usd=price
+            )
+            for (place, _), score, price in zip(scored_places, scores.tolist(), prices.tolist())
+        ]
         
-        processing_time_ms = int((time.time() - start_time) * 1000)
+        processing_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
         
-        response = RecommendationsResponse(
-            city=request.city,
-            total_candidates=len(places),
-            recommendations=recommendations,
-            processing_time_ms=processing_time_ms
-        )
+        if accept and NDJSON_MEDIA_TYPE in accept:
+            logger.info(f"Streaming {len(recommendations)} recommendations in {processing_time_ms}ms")
+            return StreamingResponse(
+                _ndjson_lines(recommendations),
+                media_type=NDJSON_MEDIA_TYPE,
+                headers={"X-Total-Candidates": str(len(places))}
+            )
         
         logger.info(f"Returned {len(recommendations)} recommendations in {processing_time_ms}ms")
         
-        return response
+        # Items are already typed, dump the list in one pass and skip response_model re-validation
+        return ORJSONResponse({
+            "city": request.city,
+            "total_candidates": len(places),
+            "recommendations": RECO_LIST_ADAPTER.dump_python(recommendations),
+            "processing_time_ms": processing_time_ms
+        })
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting recommendations: {e}", exc_info=True)
+        logger.error(f"Error getting recommendations: {e}", exc_info=settings.DEBUG)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get recommendations: {str(e)}"
@@ -1,8 +1,8 @@
 """
 Pydantic Request Models for API
 """
-from pydantic import BaseModel, Field, validator
-from typing import List, Optional
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from typing import List, Literal, Optional
 from datetime import date, datetime
 from src.models import UserPreference
 
@@ -14,7 +14,7 @@ class GenerateItineraryRequest(BaseModel):
     city: str = Field(
         ...,
         description="Destination city name",
-        example="Ho Chi Minh City",
+        examples=["Ho Chi Minh City"],
         min_length=2
     )
     num_days: int = Field(
@@ -22,64 +22,49 @@ class GenerateItineraryRequest(BaseModel):
         description="Number of days for the trip",
         ge=1,
         le=14,
-        example=3
+        examples=[3]
     )
     start_date: date = Field(
         ...,
         description="Start date of the trip (YYYY-MM-DD)",
-        example="2025-12-20"
+        examples=["2025-12-20"]
     )
     
     # User preferences
     interests: List[str] = Field(
         default=["culture", "food"],
         description="List of user interests",
-        example=["culture", "food", "nature", "shopping"]
+        examples=[["culture", "food", "nature", "shopping"]]
     )
-    budget: str = Field(
+    budget: Literal["low", "medium", "high"] = Field(
         default="medium",
         description="Budget range: low, medium, high",
-        example="medium"
+        examples=["medium"]
     )
-    travel_party: str = Field(
+    travel_party: Literal["solo", "couple", "family", "friends"] = Field(
         default="solo",
         description="Travel party type: solo, couple, family, friends",
-        example="solo"
+        examples=["solo"]
     )
     accommodation_type: str = Field(
         default="hotel",
         description="Accommodation type: hotel, hostel, resort",
-        example="hotel"
+        examples=["hotel"]
     )
     
     # Optional overrides
     selected_place_ids: Optional[List[str]] = Field(
         default=None,
-        description="Optional: Pre-selected place IDs to include",
-        example=None
+        description="Optional: Pre-selected place IDs to include"
     )
     hotel_place_id: Optional[str] = Field(
         default=None,
-        description="Optional: Specific hotel place ID",
-        example=None
+        description="Optional: Specific hotel place ID"
     )
     
-    @validator('budget')
-    def validate_budget(cls, v):
-        valid_budgets = ['low', 'medium', 'high']
-        if v not in valid_budgets:
-            raise ValueError(f'Budget must be one of: {valid_budgets}')
-        return v
-    
-    @validator('travel_party')
-    def validate_travel_party(cls, v):
-        valid_parties = ['solo', 'couple', 'family', 'friends']
-        if v not in valid_parties:
-            raise ValueError(f'Travel party must be one of: {valid_parties}')
-        return v
-    
-    @validator('start_date')
-    def validate_start_date(cls, v):
+    @field_validator('start_date', mode='after')
+    @classmethod
+    def validate_start_date(cls, v: date) -> date:
         if v < date.today():
             raise ValueError('Start date cannot be in the past')
         return v
@@ -97,8 +82,8 @@ class GenerateItineraryRequest(BaseModel):
             selected_places=self.selected_place_ids or []
         )
     
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "city": "Singapore",
                 "num_days": 3,
@@ -111,32 +96,32 @@ class GenerateItineraryRequest(BaseModel):
                 "hotel_place_id": None
             }
         }
+    )
 
 
 class GetRecommendationsRequest(BaseModel):
     """Request model for getting place recommendations only (without scheduling)"""
     
-    city: str = Field(..., description="Destination city", example="Bangkok")
+    city: str = Field(..., description="Destination city", examples=["Bangkok"])
     interests: List[str] = Field(
         default=["culture"],
         description="User interests",
-        example=["temples", "food", "markets"]
+        examples=[["temples", "food", "markets"]]
     )
     num_recommendations: int = Field(
         default=20,
         description="Number of recommendations to return",
         ge=5,
         le=50,
-        example=20
+        examples=[20]
     )
     selected_place_ids: Optional[List[str]] = Field(
         default=None,
-        description="Pre-selected places",
-        example=None
+        description="Pre-selected places"
     )
     
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "city": "Bangkok",
                 "interests": ["temples", "food"],
@@ -144,3 +129,4 @@ class GetRecommendationsRequest(BaseModel):
                 "selected_place_ids": None
             }
         }
+    )
@@ -1,9 +1,10 @@
 """
 Pydantic Response Models for API
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from typing import List, Optional, Dict, Any
-from datetime import date
+from datetime import date, datetime, timedelta
+import numpy as np
 
 
 class TransportInfo(BaseModel):
@@ -23,8 +24,8 @@ class PlaceDetail(BaseModel):
     types: List[str] = Field(default=[], description="Place categories")
     
     # Time information
-    arrival_time: str = Field(..., description="Arrival time (HH:MM)", example="09:00")
-    departure_time: str = Field(..., description="Departure time (HH:MM)", example="11:30")
+    arrival_time: str = Field(..., description="Arrival time (HH:MM)", examples=["09:00"])
+    departure_time: str = Field(..., description="Departure time (HH:MM)", examples=["11:30"])
     visit_duration_hours: float = Field(..., description="Visit duration in hours")
     
     # Cost
@@ -39,8 +40,8 @@ class PlaceDetail(BaseModel):
 
 class DayItinerary(BaseModel):
     """Single day itinerary"""
-    day: int = Field(..., description="Day number (1-indexed)", example=1)
-    date: str = Field(..., description="Date (YYYY-MM-DD)", example="2025-12-20")
+    day: int = Field(..., description="Day number (1-indexed)", examples=[1])
+    date: str = Field(..., description="Date (YYYY-MM-DD)", examples=["2025-12-20"])
     
     # Places scheduled for this day
     places: List[PlaceDetail] = Field(..., description="List of places to visit")
@@ -77,65 +78,93 @@ class ItineraryResponse(BaseModel):
     @classmethod
     def from_tour_itinerary(cls, tour, start_date: date, processing_time_ms: int):
         """Convert TourItinerary object to API response"""
-        from datetime import datetime
+        days = tour.daily_itineraries
+        day_places = [day.get_all_scheduled_places() for day in days]
+        all_places = [sp for places in day_places for sp in places]
+        n = len(all_places)
+        
+        # Numeric columns for every scheduled place, rounded in bulk
+        distance = np.fromiter((sp.distance_to_next_km or 0.0 for sp in all_places), dtype=np.float64, count=n)
+        travel_hours = np.fromiter((sp.travel_time_to_next_hours or 0.0 for sp in all_places), dtype=np.float64, count=n)
+        transport_cost = np.fromiter((sp.travel_cost_to_next or 0.0 for sp in all_places), dtype=np.float64, count=n)
+        visit_hours = np.fromiter((sp.visit_duration_hours for sp in all_places), dtype=np.float64, count=n)
+        price = np.fromiter((sp.place.avg_price or 0.0 for sp in all_places), dtype=np.float64, count=n)
+        
+        distance_r = np.round(distance, 2).tolist()
+        duration_min_r = np.round(travel_hours * 60, 1).tolist()
+        transport_cost_r = np.round(transport_cost, 2).tolist()
+        price_r = np.round(price, 2).tolist()
+        
+        place_details = [
+            PlaceDetail.model_construct(
+                place_id=sp.place.place_id,
+                name=sp.place.name,
+                rating=sp.place.rating,
+                price_level=sp.place.price_level,
+                types=sp.place.types[:3],
+                arrival_time=sp.arrival_time.strftime("%H:%M"),
+                departure_time=sp.departure_time.strftime("%H:%M"),
+                visit_duration_hours=sp.visit_duration_hours,
+                estimated_cost_usd=price_r[i],
+                transport_to_next=TransportInfo.model_construct(
+                    mode=sp.transport_to_next,
+                    distance_km=distance_r[i],
+                    duration_minutes=duration_min_r[i],
+                    cost_usd=transport_cost_r[i]
+                ) if sp.transport_to_next and distance[i] > 0 else None
+            )
+            for i, sp in enumerate(all_places)
+        ]
+        
+        # Per-day totals via segment sums over the flat arrays (empty days sum to 0)
+        counts = [len(places) for places in day_places]
+        offsets = np.cumsum([0] + counts)
+        
+        def day_sums(values: np.ndarray) -> np.ndarray:
+            cumulative = np.concatenate(([0.0], np.cumsum(values)))
+            return cumulative[offsets[1:]] - cumulative[offsets[:-1]]
+        
+        # Day cost = block transport costs + place prices (same as DayItinerary.get_total_cost,
+        # without re-walking every scheduled place per day)
+        block_cost = np.fromiter(
+            (sum(block.total_cost for block in day.blocks) for day in days),
+            dtype=np.float64, count=len(days)
+        )
+        day_cost = block_cost + day_sums(price)
+        
+        # All totals rounded in one vectorized pass
+        day_cost_r = np.round(day_cost, 2).tolist()
+        day_distance_r = np.round(day_sums(distance), 2).tolist()
+        day_hours_r = np.round(day_sums(visit_hours) + day_sums(travel_hours), 2).tolist()
+        total_cost_r, total_distance_r = np.round([day_cost.sum(), distance.sum()], 2).tolist()
         
         daily_itineraries = []
-        for day in tour.daily_itineraries:
-            places = []
-            for scheduled_place in day.get_all_scheduled_places():
-                place = scheduled_place.place
-                
-                # Build place detail
-                place_detail = PlaceDetail(
-                    place_id=place.place_id,
-                    name=place.name,
-                    rating=place.rating,
-                    price_level=place.price_level,
-                    types=place.types[:3] if hasattr(place, 'types') else [],
-                    arrival_time=scheduled_place.arrival_time.strftime("%H:%M"),
-                    departure_time=scheduled_place.departure_time.strftime("%H:%M"),
-                    visit_duration_hours=scheduled_place.visit_duration_hours,
-                    estimated_cost_usd=round(place.avg_price_usd, 2),
-                    transport_to_next=TransportInfo(
-                        mode=scheduled_place.transport_mode,
-                        distance_km=round(scheduled_place.distance_to_next, 2),
-                        duration_minutes=round(scheduled_place.travel_time_to_next * 60, 1),
-                        cost_usd=round(scheduled_place.transport_cost, 2)
-                    ) if scheduled_place.distance_to_next > 0 else None
-                )
-                places.append(place_detail)
-            
+        for k, day in enumerate(days):
             # Calculate day date
-            day_date = start_date
-            if hasattr(day, 'date') and day.date:
-                day_date = day.date
-            else:
-                from datetime import timedelta
-                day_date = start_date + timedelta(days=day.day_number - 1)
+            day_date = day.date if getattr(day, 'date', None) else start_date + timedelta(days=day.day_number - 1)
             
-            daily_itineraries.append(DayItinerary(
+            daily_itineraries.append(DayItinerary.model_construct(
                 day=day.day_number,
                 date=str(day_date),
-                places=places,
-                total_places=len(places),
-                total_cost_usd=round(day.get_total_cost(), 2),
-                total_distance_km=round(day.get_total_distance(), 2),
-                total_duration_hours=round(day.get_total_duration(), 2)
+                places=place_details[offsets[k]:offsets[k + 1]],
+                total_places=counts[k],
+                total_cost_usd=day_cost_r[k],
+                total_distance_km=day_distance_r[k],
+                total_duration_hours=day_hours_r[k]
             ))
         
-        return cls(
+        return cls.model_construct(
             destination=tour.destination,
             start_date=str(start_date),
             duration_days=tour.duration_days,
             daily_itineraries=daily_itineraries,
-            total_places=tour.get_total_places(),
-            total_cost_usd=round(tour.get_total_cost(), 2),
-            total_distance_km=round(tour.get_total_distance(), 2),
+            total_places=n,
+            total_cost_usd=total_cost_r,
+            total_distance_km=total_distance_r,
             processing_time_ms=processing_time_ms,
             generated_at=datetime.now().isoformat()
         )
 
-
 class RecommendationItem(BaseModel):
     """Single recommended place"""
     place_id: str
@@ -160,3 +189,19 @@ class ErrorResponse(BaseModel):
     error: str = Field(..., description="Error type")
     message: str = Field(..., description="Error message")
     details: Optional[Dict[str, Any]] = Field(None, description="Additional details")
+
+
+# Prebuilt adapter for bulk list dumps (skips per-item model_dump calls)
+RECO_LIST_ADAPTER = TypeAdapter(List[RecommendationItem])
+
+
+def build_schemas():
+    """Eagerly build the request/response validators (called at app startup)"""
+    from api.schemas.request import GenerateItineraryRequest, GetRecommendationsRequest
+    
+    for model in (
+        GenerateItineraryRequest, GetRecommendationsRequest,
+        TransportInfo, PlaceDetail, DayItinerary, ItineraryResponse,
+        RecommendationItem, RecommendationsResponse, ErrorResponse
+    ):
+        model.model_rebuild(force=True)
@@ -2,13 +2,16 @@
 Configuration Management using Environment Variables
 """
 import os
-from typing import Optional
-from pydantic_settings import BaseSettings
+from functools import lru_cache
+from typing import Optional, Tuple
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
     """Application settings from environment variables"""
     
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=True)
+    
     # Application
     APP_NAME: str = "Smart Travel Recommendation API"
     APP_VERSION: str = "1.0.0"
@@ -17,6 +20,9 @@ class Settings(BaseSettings):
     # MongoDB
     MONGODB_URI: str = "mongodb://localhost:27017/"
     MONGODB_DB: str = "smart_travel"
+    MONGODB_MAX_POOL_SIZE: int = 50
+    MONGODB_MIN_POOL_SIZE: int = 5
+    MONGODB_MAX_IDLE_TIME_MS: int = 30000
     
     # API Security
     API_KEY: Optional[str] = None
@@ -29,14 +35,24 @@ class Settings(BaseSettings):
     # Performance
     MAX_PLACES_PER_REQUEST: int = 200
     REQUEST_TIMEOUT_SECONDS: int = 60
+    CITY_CACHE_SIZE: int = 32  # Cities kept in memory with their places + embeddings
+    ITINERARY_CACHE_SIZE: int = 256  # Full itinerary responses kept in memory
+    ITINERARY_CACHE_TTL_SECONDS: int = 3600
     
-    # CORS
-    CORS_ORIGINS: list = ["*"]
+    # Server (uvicorn)
+    WORKERS: Optional[int] = None  # None = one worker per CPU core
+    LIMIT_CONCURRENCY: int = 1000
+    TIMEOUT_KEEP_ALIVE: int = 30
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
+    # CORS (JSON list in env, e.g. CORS_ORIGINS=["https://example.com"])
+    CORS_ORIGINS: Tuple[str, ...] = ("*",)
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the process-wide settings (.env is parsed once)"""
+    return Settings()
 
 
-# Global settings instance
-settings = Settings()
+# Global settings instance (kept for existing imports)
+settings = get_settings()
@@ -3,22 +3,75 @@ Block Scheduler
 Schedule places within time blocks with optimization
 """
 
+import heapq
 import logging
-from typing import List, Dict, Optional, Tuple
-from itertools import combinations, permutations
+from typing import Iterator, List, Dict, Optional, Tuple
 from dataclasses import dataclass
-from datetime import time, datetime, timedelta
+from datetime import time
+
+import numpy as np
 
 from src.models import Place
 from src.graph_builder import PlaceGraph
 from src.transport_manager import TransportManager, TransportMode
 from src.config import TimeBlock, BlockType, TimeBlockConfig
 from src.place_filter import PlaceFilter
+from src.scheduling_kernels import eval_sequence, search_combos_parallel
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _float_to_time(hours: float) -> time:
+    """Convert hours since midnight (>= 24 wraps to the next day) to a time of day"""
+    seconds = int(round(hours * 3600)) % 86400
+    return time(seconds // 3600, (seconds % 3600) // 60, seconds % 60)
+
+
+def _combinations_by_score(scores: np.ndarray, k: int) -> Iterator[Tuple[float, Tuple[int, ...]]]:
+    """
+    Yield k-combinations of indices in descending order of summed score
+    
+    Best-first expansion over a heap (like a k-way merge): scores must be
+    sorted descending, so (0, ..., k-1) is the best combination and each
+    successor moves one index one step right.
+    
+    Yields:
+        (score sum, combination) pairs
+    """
+    n = len(scores)
+    if k > n:
+        return
+    
+    first = tuple(range(k))
+    heap = [(-float(scores[list(first)].sum()), first)]
+    seen = {first}
+    
+    while heap:
+        neg_sum, combo = heapq.heappop(heap)
+        yield -neg_sum, combo
+        
+        for pos in range(k):
+            nxt = combo[pos] + 1
+            limit = combo[pos + 1] if pos + 1 < k else n
+            if nxt >= limit:
+                continue
+            
+            succ = combo[:pos] + (nxt,) + combo[pos + 1:]
+            if succ not in seen:
+                seen.add(succ)
+                heapq.heappush(heap, (neg_sum + scores[combo[pos]] - scores[nxt], succ))
+
+
+def _meal_travel_penalty(distances_km: np.ndarray) -> np.ndarray:
+    """Score penalty for travelling to a meal: 0.1 per hour for trips over 18 min"""
+    travel_times = TransportManager.travel_times_batch(
+        distances_km,
+        available_time_hours=0.5  # Max 30 min travel
+    )
+    return 0.1 * np.where(travel_times > 0.3, travel_times, 0.0)
+
+
+@dataclass(slots=True)
 class ScheduledPlace:
     """A place scheduled in a time block"""
     place: Place
@@ -33,7 +86,7 @@ class ScheduledPlace:
     travel_cost_to_next: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BlockSchedule:
     """Schedule for a single time block"""
     block: TimeBlock
@@ -46,6 +99,20 @@ class BlockSchedule:
     reason: str
 
 
+@dataclass
+class TravelMatrices:
+    """
+    Pairwise travel data for a block's top candidates
+    
+    Rows/cols 0..n-1 are the candidates; row/col n is the previous location
+    (when there is one).
+    """
+    distance_km: np.ndarray  # (m, m) shortest-path distances
+    travel_time_hours: np.ndarray  # (m, m)
+    cost_usd: np.ndarray  # (m, m)
+    mode: np.ndarray  # (m, m) transport mode names (object)
+
+
 class BlockScheduler:
     """
     Schedule places within time blocks with optimization
@@ -63,6 +130,14 @@ class BlockScheduler:
         BlockType.HOTEL: 9.0,       # Full night
     }
     
+    # Largest number of places whose orderings are enumerated exhaustively;
+    # larger combinations are ordered by the exact Held-Karp DP (2^k states)
+    EXHAUSTIVE_MAX_PLACES = 3
+    
+    # Combinations ordered per parallel kernel call (first batch, then doubling)
+    COMBO_BATCH_MIN = 4
+    COMBO_BATCH_MAX = 256
+    
     def __init__(self, graph: PlaceGraph, all_places: List[Place]):
         """
         Initialize block scheduler
@@ -74,6 +149,54 @@ class BlockScheduler:
         self.graph = graph
         self.all_places = all_places
         
+        # Place attributes as arrays (row i ↔ all_places[i]) for vectorized scoring
+        self._id_to_idx = {p.place_id: i for i, p in enumerate(all_places)}
+        self._ratings = np.array([p.rating for p in all_places], dtype=np.float64)
+    
+    def _score_candidates(
+        self,
+        candidates: List[Place],
+        hybrid_scores: Optional[Dict[str, float]]
+    ) -> np.ndarray:
+        """
+        Score candidates (hybrid score, else rating / 5)
+        
+        Ratings are gathered from self._ratings in one indexing operation.
+        
+        Returns:
+            Scores aligned with candidates
+        """
+        idx = np.array([self._id_to_idx.get(p.place_id, -1) for p in candidates], dtype=np.int64)
+        base = self._ratings[np.maximum(idx, 0)] / 5.0 if len(self._ratings) else np.zeros(len(idx))
+        
+        # Places outside all_places fall back to attribute lookup
+        for i in np.flatnonzero(idx < 0):
+            base[i] = candidates[i].rating / 5.0
+        
+        if hybrid_scores:
+            return np.fromiter(
+                (hybrid_scores.get(p.place_id, b) for p, b in zip(candidates, base.tolist())),
+                dtype=np.float64,
+                count=len(candidates)
+            )
+        
+        return base
+    
+    def _rank_candidates(
+        self,
+        candidates: List[Place],
+        hybrid_scores: Optional[Dict[str, float]],
+        top_k: int
+    ) -> Tuple[List[Place], np.ndarray]:
+        """
+        Get the top_k candidates by score as parallel (places, scores) arrays
+        
+        A stable argsort keeps equal-scored candidates in their input order.
+        """
+        scores = self._score_candidates(candidates, hybrid_scores)
+        order = np.argsort(-scores, kind='stable')[:top_k]
+        return [candidates[i] for i in order], scores[order]
+    
     def schedule_meal_block(
         self,
         block: TimeBlock,
@@ -105,64 +228,48 @@ class BlockScheduler:
                 reason="No candidates available"
             )
         
-        # Sort by score (use hybrid score if available, else rating)
-        if hybrid_scores:
-            scored_candidates = [
-                (p, hybrid_scores.get(p.place_id, p.rating / 5.0))
-                for p in candidates
-            ]
-        else:
-            scored_candidates = [(p, p.rating / 5.0) for p in candidates]
-        
-        scored_candidates.sort(key=lambda x: x[1], reverse=True)
+        # Top 10 by score (use hybrid score if available, else rating)
+        top_places, scores = self._rank_candidates(candidates, hybrid_scores, 10)
         
-        # Select best place considering travel time from previous location
-        best_place = None
-        best_score = 0
+        best_place = top_places[0]
+        best_score = float(scores[0])
         best_travel_info = None
         
-        for place, score in scored_candidates[:10]:  # Check top 10
-            travel_info = None
-            penalty = 0
-            
-            if previous_location:
-                # Calculate travel time and cost
-                distance = self.graph.get_shortest_distance(
+        # Without a previous location there's nothing to penalize: the top-scored candidate wins
+        if previous_location is not None:
+            def meal_distances(places: List[Place]) -> np.ndarray:
+                return self.graph.distances_from(
                     previous_location.place_id,
-                    place.place_id
-                )
-                
-                # Get transport info
-                transport_info = TransportManager.get_transport_info(
-                    distance,
-                    available_time_hours=0.5  # Max 30 min travel
+                    [p.place_id for p in places]
                 )
-                
-                travel_info = transport_info
-                
-                # Penalize distant places
-                if transport_info['travel_time_hours'] > 0.3:  # > 18 min
-                    penalty = 0.1 * transport_info['travel_time_hours']
             
-            adjusted_score = score - penalty
+            distances = meal_distances(top_places[:1])
+            adjusted = scores[:1] - _meal_travel_penalty(distances)
             
-            if adjusted_score > best_score:
-                best_score = adjusted_score
-                best_place = place
-                best_travel_info = travel_info
-        
-        if not best_place:
-            best_place = scored_candidates[0][0]
-            best_score = scored_candidates[0][1]
+            # Penalties are never negative and scores are sorted, so only the
+            # prefix scoring above the top candidate's adjusted score can beat it
+            n_contenders = int(np.count_nonzero(scores > adjusted[0]))
+            if n_contenders > 1:
+                distances = np.concatenate([distances, meal_distances(top_places[1:n_contenders])])
+                adjusted = scores[:n_contenders] - _meal_travel_penalty(distances)
+            
+            best_idx = int(np.argmax(adjusted))
+            
+            # If nothing stays positive after penalties, keep the top-scored candidate
+            if adjusted[best_idx] > 0:
+                best_place = top_places[best_idx]
+                best_score = float(adjusted[best_idx])
+                best_travel_info = TransportManager.get_transport_info(
+                    float(distances[best_idx]),
+                    available_time_hours=0.5
+                )
         
         # Schedule the place
         visit_duration = self.DEFAULT_VISIT_DURATIONS[block.block_type]
         
         # Calculate times
         arrival_time = block.start_time
-        departure_dt = datetime.combine(datetime.today(), arrival_time) + \
-                       timedelta(hours=visit_duration)
-        departure_time = departure_dt.time()
+        departure_time = _float_to_time(block.hour_bounds[0] + visit_duration)
         
         scheduled = ScheduledPlace(
             place=best_place,
@@ -172,17 +279,13 @@ class BlockScheduler:
             score=best_score
         )
         
-        total_cost = 0
-        if best_travel_info:
-            total_cost = best_travel_info.get('cost_usd', 0)
-        
         return BlockSchedule(
             block=block,
             scheduled_places=[scheduled],
             total_score=best_score,
-            total_travel_time_hours=best_travel_info['travel_time_hours'] if best_travel_info else 0,
+            total_travel_time_hours=best_travel_info.travel_time_hours if best_travel_info else 0,
             total_visit_time_hours=visit_duration,
-            total_cost=total_cost,
+            total_cost=best_travel_info.cost_usd if best_travel_info else 0,
             success=True,
             reason=f"Selected {best_place.name} (score: {best_score:.3f})"
         )
@@ -220,39 +323,25 @@ class BlockScheduler:
             )
         
         num_places = block.num_places
-        available_hours = block.get_available_hours()
+        available_hours = block.available_hours
         visit_duration = self.DEFAULT_VISIT_DURATIONS.get(block.block_type, 1.0)
         
-        # Get scores
-        if hybrid_scores:
-            scored_candidates = [
-                (p, hybrid_scores.get(p.place_id, p.rating / 5.0))
-                for p in candidates
-            ]
-        else:
-            scored_candidates = [(p, p.rating / 5.0) for p in candidates]
+        # Block bounds as hours since midnight, cached on the block
+        start_h, end_h = block.hour_bounds
         
-        scored_candidates.sort(key=lambda x: x[1], reverse=True)
+        # Limit candidates to top K by score for performance
+        top_places, top_scores = self._rank_candidates(candidates, hybrid_scores, 20)
         
-        # Limit candidates to top K for performance
-        top_k = min(20, len(scored_candidates))
-        top_candidates = scored_candidates[:top_k]
-        
-        # Try combinations
         best_schedule = None
-        best_total_score = 0
         
         # Special case: only 1 place needed
         if num_places == 1:
-            place, score = top_candidates[0]
+            place, score = top_places[0], float(top_scores[0])
             
             scheduled_place = ScheduledPlace(
                 place=place,
                 arrival_time=block.start_time,
-                departure_time=(datetime.combine(
-                    datetime.today(),
-                    block.start_time
-                ) + timedelta(hours=visit_duration)).time(),
+                departure_time=_float_to_time(start_h + visit_duration),
                 visit_duration_hours=visit_duration,
                 score=score
             )
@@ -268,173 +357,276 @@ class BlockScheduler:
                 reason=f"Selected {place.name}"
             )
         
-        # Try combinations of num_places
-        for combo in combinations([p for p, s in top_candidates], num_places):
-            # Try different orderings
-            for perm in permutations(combo):
-                schedule = self._evaluate_activity_sequence(
-                    list(perm),
-                    block,
-                    previous_location,
-                    visit_duration,
-                    available_hours,
-                    hybrid_scores
-                )
-                
-                if schedule and schedule.success:
-                    if schedule.total_score > best_total_score:
-                        best_total_score = schedule.total_score
-                        best_schedule = schedule
+        # Pairwise travel between candidates, computed once per block
+        matrices = self._build_travel_matrices(top_places, previous_location)
+        prev_idx = len(top_places) if previous_location else -1
+        
+        # Best set of num_places (by score) in its least-travel order
+        best_order = self._search_combinations(
+            top_scores,
+            num_places,
+            matrices,
+            prev_idx,
+            start_h,
+            end_h,
+            visit_duration,
+            available_hours
+        )
+        
+        if best_order:
+            best_schedule = self._evaluate_activity_sequence(
+                best_order,
+                top_places,
+                top_scores,
+                matrices,
+                prev_idx,
+                block,
+                start_h,
+                end_h,
+                visit_duration,
+                available_hours
+            )
         
         if best_schedule:
             return best_schedule
         
         # Fallback: just take top places without optimization
-        fallback_places = [p for p, s in top_candidates[:num_places]]
         return self._create_simple_schedule(
-            fallback_places,
+            top_places[:num_places],
+            top_scores[:num_places],
             block,
-            visit_duration,
-            hybrid_scores
+            start_h,
+            visit_duration
         )
     
-    def _evaluate_activity_sequence(
+    def _build_travel_matrices(
         self,
         places: List[Place],
-        block: TimeBlock,
-        previous_location: Optional[Place],
-        visit_duration: float,
-        available_hours: float,
-        hybrid_scores: Optional[Dict[str, float]]
-    ) -> Optional[BlockSchedule]:
-        """Evaluate if a sequence of places fits in block"""
-        
-        scheduled_places = []
-        current_time_dt = datetime.combine(datetime.today(), block.start_time)
-        total_travel_time = 0
-        total_cost = 0
-        total_score = 0
+        previous_location: Optional[Place]
+    ) -> TravelMatrices:
+        """
+        Precompute distances and transport info between all candidate pairs
         
-        current_location = previous_location
+        Distances come from the graph by int index in one submatrix
+        gather; each pair is run through transport selection once, instead
+        of once per evaluated sequence.
         
-        for i, place in enumerate(places):
-            # Calculate travel FROM previous location TO current place
-            travel_time = 0
-            travel_cost = 0
+        Args:
+            places: Candidate places
+            previous_location: Previous place, appended as the last row/col
             
-            if current_location:
-                distance = self.graph.get_shortest_distance(
-                    current_location.place_id,
-                    place.place_id
-                )
-                
-                transport_info = TransportManager.get_transport_info(distance)
-                travel_time = transport_info['travel_time_hours']
-                travel_cost = transport_info['cost_usd']
+        Returns:
+            TravelMatrices indexed by candidate position
+        """
+        if previous_location:
+            places = places + [previous_location]
+        
+        # Graph indices, resolved once so the graph is queried by int index
+        id_to_idx = self.graph.id_to_idx
+        idx = np.array([id_to_idx.get(p.place_id, -1) for p in places], dtype=np.int64)
+        if (idx < 0).any():
+            logger.warning(f"{int((idx < 0).sum())} candidate(s) not in graph")
+        
+        distance = self.graph.distance_submatrix(idx)
+        
+        m = len(places)
+        travel_time = np.zeros((m, m), dtype=np.float64)
+        cost = np.zeros((m, m), dtype=np.float64)
+        mode = np.full((m, m), TransportMode.WALKING.value, dtype=object)
+        
+        # Distances are symmetric, so each pair is run through transport selection once
+        for i in range(m):
+            for j in range(i + 1, m):
+                info = TransportManager.get_transport_info(float(distance[i, j]))
                 
-                # Add travel time
-                current_time_dt += timedelta(hours=travel_time)
-                total_travel_time += travel_time
-                total_cost += travel_cost
-            
-            # Arrival time (includes travel time)
-            arrival_time = current_time_dt.time()
-            
-            # Visit
-            current_time_dt += timedelta(hours=visit_duration)
-            departure_time = current_time_dt.time()
-            
-            # Check if we exceed block
-            block_end_dt = datetime.combine(datetime.today(), block.end_time)
-            if block.end_time < block.start_time:  # Overnight
-                block_end_dt += timedelta(days=1)
-            
-            if current_time_dt > block_end_dt:
-                # Doesn't fit
-                return None
-            
-            # Get score
-            score = hybrid_scores.get(place.place_id, place.rating / 5.0) \
-                    if hybrid_scores else place.rating / 5.0
-            total_score += score
-            
-            # Calculate transport TO NEXT place (if not last)
-            transport_to_next = None
-            distance_to_next = None
-            travel_time_to_next = None
-            travel_cost_to_next = None
-            
-            if i < len(places) - 1:
-                next_place = places[i + 1]
-                distance_to_next = self.graph.get_shortest_distance(
-                    place.place_id,
-                    next_place.place_id
-                )
-                next_transport_info = TransportManager.get_transport_info(distance_to_next)
-                transport_to_next = next_transport_info['mode']
-                travel_time_to_next = next_transport_info['travel_time_hours']
-                travel_cost_to_next = next_transport_info['cost_usd']
+                travel_time[i, j] = travel_time[j, i] = info.travel_time_hours
+                cost[i, j] = cost[j, i] = info.cost_usd
+                mode[i, j] = mode[j, i] = info.mode
+        
+        return TravelMatrices(
+            distance_km=distance,
+            travel_time_hours=travel_time,
+            cost_usd=cost,
+            mode=mode
+        )
+    
+    def _search_combinations(
+        self,
+        scores: np.ndarray,
+        num_places: int,
+        matrices: TravelMatrices,
+        prev_idx: int,
+        start_h: float,
+        end_h: float,
+        visit_duration: float,
+        available_hours: float
+    ) -> Optional[List[int]]:
+        """
+        Find the highest-scoring ordered sequence of num_places that fits in block
+        
+        Combinations are generated best-first by summed score and handed in
+        batches to the parallel search_combos_parallel kernel, which orders
+        each one by minimum travel: exhaustively up to EXHAUSTIVE_MAX_PLACES
+        places, by Held-Karp beyond. The search stops at the first batch
+        containing a feasible combination.
+        
+        Args:
+            scores: Candidate scores
+            num_places: Number of places to schedule
+            matrices: Travel matrices over the candidates
+            prev_idx: Matrix index of the previous location (-1 if none)
+            start_h: Block start (hours since midnight)
+            end_h: Block end (hours since midnight, past 24 if overnight)
+            visit_duration: Visit duration per place (hours)
+            available_hours: Available hours in block
             
-            # Create scheduled place
-            scheduled = ScheduledPlace(
-                place=place,
-                arrival_time=arrival_time,
-                departure_time=departure_time,
-                visit_duration_hours=visit_duration,
-                score=score,
-                transport_to_next=transport_to_next,
-                distance_to_next_km=distance_to_next,
-                travel_time_to_next_hours=travel_time_to_next,
-                travel_cost_to_next=travel_cost_to_next
+        Returns:
+            Best sequence as candidate indices, or None if nothing fits
+        """
+        n = len(scores)
+        if n < num_places:
+            return None
+        
+        batch: List[Tuple[int, ...]] = []
+        batch_size = self.COMBO_BATCH_MIN
+        
+        def first_feasible() -> Optional[List[int]]:
+            found, perms = search_combos_parallel(
+                np.array(batch, dtype=np.int64),
+                matrices.travel_time_hours,
+                matrices.cost_usd,
+                scores,
+                start_h,
+                end_h,
+                visit_duration,
+                prev_idx,
+                available_hours,
+                self.EXHAUSTIVE_MAX_PLACES
             )
+            hits = np.flatnonzero(found)
+            return perms[hits[0]].tolist() if len(hits) else None
+        
+        # A sequence scores the sum of its places whatever the order, so
+        # the first feasible combination in descending-sum order is the best
+        for combo_score, combo in _combinations_by_score(scores, num_places):
+            if combo_score <= 0:
+                break
             
-            scheduled_places.append(scheduled)
-            current_location = place
+            batch.append(combo)
+            if len(batch) == batch_size:
+                best_order = first_feasible()
+                if best_order is not None:
+                    return best_order
+                batch = []
+                batch_size = min(batch_size * 2, self.COMBO_BATCH_MAX)
+        
+        return first_feasible() if batch else None
+    
+    def _evaluate_activity_sequence(
+        self,
+        order: List[int],
+        places: List[Place],
+        scores: np.ndarray,
+        matrices: TravelMatrices,
+        prev_idx: int,
+        block: TimeBlock,
+        start_h: float,
+        end_h: float,
+        visit_duration: float,
+        available_hours: float
+    ) -> Optional[BlockSchedule]:
+        """
+        Evaluate if a sequence of places (indices into places/matrices) fits in block
+        
+        Feasibility and totals come from the compiled eval_sequence kernel;
+        ScheduledPlace objects are only built for sequences that fit; times
+        stay in float hours (start_h/end_h hoisted by the caller) until then.
+        """
+        order_arr = np.asarray(order, dtype=np.int64)
+        
+        total_score, total_travel_time, total_cost, fits = eval_sequence(
+            order_arr,
+            matrices.travel_time_hours,
+            matrices.cost_usd,
+            scores,
+            start_h,
+            end_h,
+            visit_duration,
+            prev_idx,
+            available_hours
+        )
         
-        # Check total time
-        total_time = total_travel_time + visit_duration * len(places)
-        if total_time > available_hours:
+        if not fits:
             return None
         
+        # Edges between consecutive places, each looked up once: edge i is
+        # "to next" for place i and "from previous" for place i + 1
+        src, dst = order_arr[:-1], order_arr[1:]
+        edge_travel = matrices.travel_time_hours[src, dst]
+        edge_distance = matrices.distance_km[src, dst].tolist()
+        edge_cost = matrices.cost_usd[src, dst].tolist()
+        edge_mode = matrices.mode[src, dst].tolist()
+        
+        # Arrival (includes travel time) at each place, in hours since midnight
+        first_travel = matrices.travel_time_hours[prev_idx, order_arr[0]] if prev_idx >= 0 else 0.0
+        incoming = np.concatenate(([first_travel], edge_travel))
+        arrivals = (start_h + np.cumsum(incoming) + visit_duration * np.arange(len(order))).tolist()
+        edge_travel = edge_travel.tolist()
+        
+        scheduled_places = []
+        last = len(order) - 1
+        
+        for i, idx in enumerate(order):
+            has_next = i < last
+            
+            scheduled_places.append(ScheduledPlace(
+                place=places[idx],
+                arrival_time=_float_to_time(arrivals[i]),
+                departure_time=_float_to_time(arrivals[i] + visit_duration),
+                visit_duration_hours=visit_duration,
+                score=float(scores[idx]),
+                transport_to_next=edge_mode[i] if has_next else None,
+                distance_to_next_km=edge_distance[i] if has_next else None,
+                travel_time_to_next_hours=edge_travel[i] if has_next else None,
+                travel_cost_to_next=edge_cost[i] if has_next else None
+            ))
+        
         return BlockSchedule(
             block=block,
             scheduled_places=scheduled_places,
             total_score=total_score,
             total_travel_time_hours=total_travel_time,
-            total_visit_time_hours=visit_duration * len(places),
+            total_visit_time_hours=visit_duration * len(order),
             total_cost=total_cost,
             success=True,
-            reason=f"Optimized {len(places)} activities"
+            reason=f"Optimized {len(order)} activities"
         )
     
     def _create_simple_schedule(
         self,
         places: List[Place],
+        scores: np.ndarray,
         block: TimeBlock,
-        visit_duration: float,
-        hybrid_scores: Optional[Dict[str, float]]
+        start_h: float,
+        visit_duration: float
     ) -> BlockSchedule:
         """Create simple schedule without optimization"""
         
         scheduled_places = []
-        current_time_dt = datetime.combine(datetime.today(), block.start_time)
-        total_score = 0
+        current_h = start_h
+        total_score = float(scores.sum())
         
-        for place in places:
-            score = hybrid_scores.get(place.place_id, place.rating / 5.0) \
-                    if hybrid_scores else place.rating / 5.0
-            total_score += score
-            
+        for place, score in zip(places, scores.tolist()):
             scheduled = ScheduledPlace(
                 place=place,
-                arrival_time=current_time_dt.time(),
-                departure_time=(current_time_dt + timedelta(hours=visit_duration)).time(),
+                arrival_time=_float_to_time(current_h),
+                departure_time=_float_to_time(current_h + visit_duration),
                 visit_duration_hours=visit_duration,
                 score=score
             )
             
             scheduled_places.append(scheduled)
-            current_time_dt += timedelta(hours=visit_duration + 0.5)  # Add buffer
+            current_h += visit_duration + 0.5  # Add buffer
         
         return BlockSchedule(
             block=block,
@@ -480,27 +672,20 @@ class BlockScheduler:
             )
         
         # Score hotels by rating and proximity to last location
-        scored_hotels = []
+        scores = self._score_candidates(candidates, hybrid_scores)
         
-        for hotel in candidates:
-            score = hybrid_scores.get(hotel.place_id, hotel.rating / 5.0) \
-                    if hybrid_scores else hotel.rating / 5.0
-            
-            # Bonus for proximity to previous location
-            if previous_location:
-                distance = self.graph.get_shortest_distance(
-                    previous_location.place_id,
-                    hotel.place_id
-                )
-                
-                # Prefer hotels within 5km
-                proximity_bonus = max(0, 0.2 * (1 - distance / 5.0))
-                score += proximity_bonus
+        if previous_location:
+            distances = self.graph.distances_from(
+                previous_location.place_id,
+                [h.place_id for h in candidates]
+            )
             
-            scored_hotels.append((hotel, score))
+            # Bonus for hotels within 5km
+            scores += np.maximum(0.0, 0.2 * (1 - distances / 5.0))
         
-        scored_hotels.sort(key=lambda x: x[1], reverse=True)
-        best_hotel, best_score = scored_hotels[0]
+        best_idx = int(np.argmax(scores))
+        best_hotel = candidates[best_idx]
+        best_score = float(scores[best_idx])
         
         # Schedule hotel
         scheduled = ScheduledPlace(
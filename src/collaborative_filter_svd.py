@@ -7,11 +7,14 @@ import numpy as np
 from typing import List, Dict, Optional
 from scipy.sparse import csr_matrix
 from scipy.sparse.linalg import svds
+from sklearn.utils.extmath import randomized_svd
 import logging
-import pickle
+import json
 from pathlib import Path
 
 from .models import Place
+from .jit import NUMBA_AVAILABLE
+from .scoring_kernels import make_score_rows, predict_one
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +31,9 @@ class CollaborativeFilterSVD:
     - Model persistence: save/load trained model
     """
     
+    # Smallest matrix side decomposed with randomized SVD (ARPACK below)
+    RANDOMIZED_SVD_MIN_DIM = 200
+    
     def __init__(self, n_factors: int = 50, model_dir: str = "data/models"):
         """
         Initialize collaborative filter with SVD
@@ -42,14 +48,19 @@ class CollaborativeFilterSVD:
         
         # Model components
         self.user_embeddings: Optional[np.ndarray] = None  # (n_users, k)
-        self.place_embeddings: Optional[np.ndarray] = None  # (n_places, k)
+        # Place embeddings quantized row-wise: embedding ≈ place_codes * place_scales[:, None]
+        self.place_codes: Optional[np.ndarray] = None  # (n_places, k) int8
+        self.place_scales: Optional[np.ndarray] = None  # (n_places,) float32
+        self._place_code_norms: Optional[np.ndarray] = None  # (n_places,) L2 norms of code rows
+        self._place_has_norm: Optional[np.ndarray] = None  # (n_places,) bool, row norm > 0
         self.sigma: Optional[np.ndarray] = None  # (k,) singular values
+        self._score_rows = None  # Numba scoring kernel specialized for k (None without numba)
         
         # Index mappings
         self.user_to_idx: Dict[str, int] = {}
-        self.idx_to_user: Dict[int, str] = {}
+        self.idx_to_user_arr: np.ndarray = np.empty(0, dtype=object)  # idx -> user_id
         self.place_to_idx: Dict[str, int] = {}
-        self.idx_to_place: Dict[int, str] = {}
+        self.idx_to_place_arr: np.ndarray = np.empty(0, dtype=object)  # idx -> place_id
         
         # Training status
         self.is_trained = False
@@ -72,50 +83,56 @@ class CollaborativeFilterSVD:
         Returns:
             Sparse rating matrix (n_users × n_places)
         """
-        # Extract unique users and places
-        users = sorted(set(i['user_id'] for i in interactions))
-        places = sorted(set(i['place_id'] for i in interactions))
+        n = len(interactions)
+        
+        # Unique (sorted) users and places, with each interaction's row/col index
+        users, rows = np.unique(
+            np.array([i['user_id'] for i in interactions]), return_inverse=True
+        )
+        places, cols = np.unique(
+            np.array([i['place_id'] for i in interactions]), return_inverse=True
+        )
+        users = users.tolist()
+        places = places.tolist()
         
         # Build index mappings
-        self.user_to_idx = {u: idx for idx, u in enumerate(users)}
-        self.idx_to_user = {idx: u for u, idx in self.user_to_idx.items()}
+        self.user_to_idx = dict(zip(users, range(len(users))))
+        self.idx_to_user_arr = np.array(users, dtype=object)
         
-        self.place_to_idx = {p: idx for idx, p in enumerate(places)}
-        self.idx_to_place = {idx: p for p, idx in self.place_to_idx.items()}
+        self.place_to_idx = dict(zip(places, range(len(places))))
+        self.idx_to_place_arr = np.array(places, dtype=object)
         
         # Build sparse matrix
         n_users = len(users)
         n_places = len(places)
         
-        rows = []
-        cols = []
-        data = []
-        ratings_sum = 0
+        ratings = np.fromiter(
+            (i.get('rating', 0) for i in interactions), dtype=np.float32, count=n
+        )
+        
+        # Only include non-zero ratings
+        mask = ratings > 0
         
-        for interaction in interactions:
-            user_id = interaction['user_id']
-            place_id = interaction['place_id']
-            rating = interaction.get('rating', 0)
-            
-            if rating > 0:  # Only include non-zero ratings
-                u_idx = self.user_to_idx[user_id]
-                p_idx = self.place_to_idx[place_id]
-                
-                rows.append(u_idx)
-                cols.append(p_idx)
-                data.append(rating)
-                ratings_sum += rating
+        # Sort by (row, col) and average repeated ratings of a pair, which
+        # yields CSR arrays that are already canonical (no scipy re-sort)
+        keys, inverse = np.unique(
+            rows[mask].astype(np.int64) * n_places + cols[mask], return_inverse=True
+        )
+        data = (
+            np.bincount(inverse, weights=ratings[mask]) / np.bincount(inverse)
+        ).astype(np.float32)
+        indices = (keys % n_places).astype(np.int32)
+        indptr = np.zeros(n_users + 1, dtype=np.int32)
+        np.cumsum(np.bincount(keys // n_places, minlength=n_users), out=indptr[1:])
+        count = len(data)
         
         # Calculate global mean
-        if len(data) > 0:
-            self.global_mean_rating = ratings_sum / len(data)
-        
-        # Create sparse matrix
-        R = csr_matrix(
-            (data, (rows, cols)),
-            shape=(n_users, n_places),
-            dtype=np.float32
-        )
+        if count > 0:
+            self.global_mean_rating = float(data.mean(dtype=np.float64))
+        
+        # Create sparse matrix directly from its CSR arrays
+        R = csr_matrix((data, indices, indptr), shape=(n_users, n_places))
+        R.has_sorted_indices = True
         
         # Calculate density
         density = len(data) / (n_users * n_places) * 100
@@ -144,6 +161,10 @@ class CollaborativeFilterSVD:
         # Build interaction matrix
         R = self._build_interaction_matrix(interactions)
         
+        # Center observed ratings on the global mean (unobserved entries stay
+        # 0), so no factor is spent on the mean offset; predictions add it back
+        R.data -= self.global_mean_rating
+        
         n_users, n_places = R.shape
         
         # Adjust k if necessary
@@ -155,35 +176,45 @@ class CollaborativeFilterSVD:
         try:
             logger.info(f"Computing SVD (k={k})...")
             
-            # svds returns (u, sigma, vt)
             # u: (n_users, k)
-            # sigma: (k,) - singular values
+            # sigma: (k,) - singular values, descending
             # vt: (k, n_places)
-            U, sigma, Vt = svds(R.astype(np.float32), k=k)
-            
-            # SVD returns components in ascending order, we want descending
-            # Reverse the order
-            U = U[:, ::-1]
-            sigma = sigma[::-1]
-            Vt = Vt[::-1, :]
+            if min(n_users, n_places) >= self.RANDOMIZED_SVD_MIN_DIM:
+                # Randomized range finder: a few passes over R instead of
+                # many ARPACK Lanczos matvecs
+                U, sigma, Vt = randomized_svd(
+                    R, n_components=k, n_iter=4, random_state=42
+                )
+            else:
+                # Small matrices: ARPACK is cheap and exact (R is already float32)
+                U, sigma, Vt = svds(R, k=k)
+                
+                # svds returns components in ascending order, we want descending
+                U = U[:, ::-1]
+                sigma = sigma[::-1]
+                Vt = Vt[::-1, :]
             
             # Store embeddings
             # User embedding: U × sqrt(Σ)
             # Place embedding: V × sqrt(Σ) where V = Vt.T
             sqrt_sigma = np.sqrt(sigma)
             
-            self.user_embeddings = U * sqrt_sigma  # (n_users, k)
-            self.place_embeddings = Vt.T * sqrt_sigma  # (n_places, k)
+            # C-contiguous float32 rows so gathers and matvecs hit the BLAS fast path
+            self.user_embeddings = np.ascontiguousarray(U * sqrt_sigma, dtype=np.float32)  # (n_users, k)
+            self._quantize_place_embeddings(Vt.T * sqrt_sigma)  # (n_places, k)
             self.sigma = sigma
             
             self.is_trained = True
             
             logger.info("SVD training completed successfully")
             logger.info(f"User embeddings shape: {self.user_embeddings.shape}")
-            logger.info(f"Place embeddings shape: {self.place_embeddings.shape}")
+            logger.info(f"Place embeddings shape: {self.place_codes.shape} (int8)")
             
-            # Log variance explained
-            variance_explained = np.sum(sigma) / np.sum(sigma) * 100
+            # Log variance explained: captured energy sum(σ²) over ||R||_F²
+            # (R is sparse, so the Frobenius norm is just its stored values)
+            total_energy = float(np.dot(R.data, R.data.astype(np.float64)))
+            captured_energy = float(np.sum(np.square(sigma, dtype=np.float64)))
+            variance_explained = 100.0 * captured_energy / total_energy if total_energy > 0 else 0.0
             logger.info(f"Top {k} factors explain {variance_explained:.1f}% variance")
             
             # Save model
@@ -194,6 +225,45 @@ class CollaborativeFilterSVD:
             logger.error(f"SVD training failed: {e}")
             self.is_trained = False
     
+    def _quantize_place_embeddings(self, place_embeddings: np.ndarray):
+        """
+        Store place embeddings as row-wise int8 codes with a float32 scale per row
+        
+        Scores are dot products clipped to [0, 5], so 8 bits per factor are
+        plenty; inference reads a quarter of the float32 bytes.
+        """
+        # Vt.T * sqrt_sigma is Fortran-ordered; codes must be row-major like the users
+        place_embeddings = np.ascontiguousarray(place_embeddings, dtype=np.float32)
+        max_abs = np.abs(place_embeddings).max(axis=1, initial=0.0)
+        
+        self.place_scales = np.where(max_abs > 0, max_abs / 127.0, 1.0).astype(np.float32)
+        self.place_codes = np.round(place_embeddings / self.place_scales[:, None]).astype(np.int8)
+        self._index_place_codes()
+    
+    def _index_place_codes(self):
+        """Cache code row norms for cosine similarity (scales cancel out) and the k-specialized scorer"""
+        self._place_code_norms = np.linalg.norm(self.place_codes.astype(np.float32), axis=1)
+        self._place_has_norm = self._place_code_norms > 0
+        
+        if NUMBA_AVAILABLE:
+            self._score_rows = make_score_rows(self.place_codes.shape[1])
+    
+    def _candidate_rows(self, candidate_places: List[Place]) -> np.ndarray:
+        """
+        Embedding rows of candidate places (-1 for places not in training)
+        
+        Returns:
+            Read-only (n,) int64 array aligned with candidate_places
+        """
+        idx = np.fromiter(
+            (self.place_to_idx.get(p.place_id, -1) for p in candidate_places),
+            dtype=np.int64,
+            count=len(candidate_places)
+        )
+        # Read-only like the model arrays, matching the warmed-up kernel signature
+        idx.setflags(write=False)
+        return idx
+    
     def predict(self, user_id: str, place_id: str) -> float:
         """
         Predict rating for user-place pair
@@ -208,26 +278,25 @@ class CollaborativeFilterSVD:
         if not self.is_trained:
             return self.global_mean_rating
         
-        # Check if user/place in training set
-        if user_id not in self.user_to_idx or place_id not in self.place_to_idx:
-            # Cold start: return global mean
+        # Check if user/place in training set (cold start: global mean)
+        u_idx = self.user_to_idx.get(user_id)
+        p_idx = self.place_to_idx.get(place_id)
+        if u_idx is None or p_idx is None:
             return self.global_mean_rating
         
-        # Get indices
-        u_idx = self.user_to_idx[user_id]
-        p_idx = self.place_to_idx[place_id]
+        if NUMBA_AVAILABLE:
+            return predict_one(
+                self.user_embeddings, self.place_codes, self.place_scales,
+                u_idx, p_idx, self.global_mean_rating
+            )
         
-        # Get embeddings
-        user_vec = self.user_embeddings[u_idx]  # (k,)
-        place_vec = self.place_embeddings[p_idx]  # (k,)
+        # Predicted rating = global mean + dot product (dequantized by the row scale),
+        # clipped with scalar min/max instead of dispatching np.clip
+        predicted = self.global_mean_rating + float(
+            np.dot(self.user_embeddings[u_idx], self.place_codes[p_idx].astype(np.float32))
+        ) * float(self.place_scales[p_idx])
         
-        # Predicted rating = dot product
-        predicted = np.dot(user_vec, place_vec)
-        
-        # Clip to valid range
-        predicted = np.clip(predicted, 0, 5)
-        
-        return float(predicted)
+        return min(5.0, max(0.0, predicted))
     
     def calculate_collaborative_scores(
         self,
@@ -244,49 +313,69 @@ class CollaborativeFilterSVD:
         Returns:
             Dict mapping place_id to collaborative score [0, 1]
         """
+        scores = self.calculate_collaborative_score_array(user_id, candidate_places)
+        return dict(zip((p.place_id for p in candidate_places), scores.tolist()))
+    
+    def calculate_collaborative_score_array(
+        self,
+        user_id: str,
+        candidate_places: List[Place]
+    ) -> np.ndarray:
+        """
+        Calculate collaborative scores for candidate places as an array
+        
+        Args:
+            user_id: User ID
+            candidate_places: Places to score
+            
+        Returns:
+            (n,) float64 scores in [0, 1], aligned with candidate_places
+        """
         if not self.is_trained:
             logger.warning("Model not trained, returning default scores (0.5)")
-            return {place.place_id: 0.5 for place in candidate_places}
+            return np.full(len(candidate_places), 0.5)
         
         # Cold start for new user
-        if user_id not in self.user_to_idx:
+        u_idx = self.user_to_idx.get(user_id)
+        if u_idx is None:
             logger.info(f"User {user_id} not in training set (cold start), returning default scores")
-            return {place.place_id: 0.5 for place in candidate_places}
+            return np.full(len(candidate_places), 0.5)
         
         # Get user embedding
-        u_idx = self.user_to_idx[user_id]
         user_vec = self.user_embeddings[u_idx]  # (k,)
         
-        # Score each candidate
-        scores = {}
+        # Candidate rows in the embedding matrix (-1 for places not in training)
+        idx = self._candidate_rows(candidate_places)
         
-        for place in candidate_places:
-            if place.place_id in self.place_to_idx:
-                # Place in training set - predict rating
-                p_idx = self.place_to_idx[place.place_id]
-                place_vec = self.place_embeddings[p_idx]
-                
-                # Predicted rating
-                predicted_rating = np.dot(user_vec, place_vec)
-                predicted_rating = np.clip(predicted_rating, 0, 5)
-                
-                # Normalize to [0, 1]
-                normalized_score = predicted_rating / 5.0
-                
-            else:
-                # New place (not in training) - use average
-                normalized_score = self.global_mean_rating / 5.0
-            
-            scores[place.place_id] = float(normalized_score)
+        # Predicted ratings clipped and normalized to [0, 1]; new places
+        # (not in training) get the average
+        default_score = self.global_mean_rating / 5.0
         
-        logger.info(f"Calculated collaborative scores for {len(scores)} candidate places")
+        if self._score_rows is not None:
+            # Fused gather + dot + clip in one compiled pass
+            normalized = np.empty(len(candidate_places))
+            self._score_rows(
+                user_vec, self.place_codes, self.place_scales, idx,
+                self.global_mean_rating, default_score, normalized
+            )
+        else:
+            known = idx >= 0
+            normalized = np.full(len(candidate_places), default_score)
+            if known.any():
+                # One matrix-vector product for all known places
+                rows = idx[known]
+                predicted = (self.place_codes[rows].astype(np.float32) @ user_vec) * self.place_scales[rows]
+                predicted += self.global_mean_rating
+                np.clip(predicted, 0, 5, out=predicted)
+                normalized[known] = predicted / 5.0
+        
+        logger.info(f"Calculated collaborative scores for {len(normalized)} candidate places")
         
         # Log statistics
-        if scores:
-            avg_score = np.mean(list(scores.values()))
-            logger.info(f"Avg collaborative score: {avg_score:.3f}")
+        if len(normalized):
+            logger.info(f"Avg collaborative score: {normalized.mean():.3f}")
         
-        return scores
+        return normalized
     
     def get_similar_places(
         self,
@@ -312,38 +401,114 @@ class CollaborativeFilterSVD:
         
         # Get reference place embedding
         p_idx = self.place_to_idx[place_id]
-        ref_vec = self.place_embeddings[p_idx]
-        ref_norm = np.linalg.norm(ref_vec)
-        
-        if ref_norm == 0:
+        if not self._place_has_norm[p_idx]:
             return []
         
-        # Calculate similarity with all places
-        similarities = []
+        ref_codes = self.place_codes[p_idx].astype(np.float32)
+        ref_norm = self._place_code_norms[p_idx]
         
         # Determine search space
         if candidate_places:
-            search_place_ids = [p.place_id for p in candidate_places if p.place_id in self.place_to_idx]
+            search_idx = self._candidate_rows(candidate_places)
+            search_idx = search_idx[search_idx >= 0]
         else:
-            search_place_ids = list(self.place_to_idx.keys())
+            search_idx = np.arange(len(self.place_to_idx), dtype=np.int64)
         
-        for pid in search_place_ids:
-            if pid == place_id:
-                continue  # Skip self
-            
-            p_idx = self.place_to_idx[pid]
-            place_vec = self.place_embeddings[p_idx]
-            place_norm = np.linalg.norm(place_vec)
+        # Skip self and zero-norm places
+        search_idx = search_idx[(search_idx != p_idx) & self._place_has_norm[search_idx]]
+        
+        # Cosine similarity with all search places in one matrix-vector product
+        sims = (self.place_codes[search_idx].astype(np.float32) @ ref_codes) \
+            / (self._place_code_norms[search_idx] * ref_norm)
+        
+        # Top-k by similarity: O(n) partition, then sort only the winners
+        if k < len(sims):
+            top = np.argpartition(-sims, k)[:k]
+        else:
+            top = np.arange(len(sims))
+        top = top[np.argsort(-sims[top], kind='stable')]
+        
+        top_idx = search_idx[top]
+        return list(zip(self.idx_to_place_arr[top_idx].tolist(), sims[top].tolist()))
+    
+    def get_similar_places_batch(
+        self,
+        place_ids: List[str],
+        k: int = 10,
+        candidate_places: Optional[List[Place]] = None
+    ) -> Dict[str, List[tuple]]:
+        """
+        Find places similar to each of several reference places
+        
+        Same result as calling get_similar_places per reference, but all
+        cosine similarities come from one matrix-matrix product.
+        
+        Args:
+            place_ids: Reference place IDs
+            k: Number of similar places to return per reference
+            candidate_places: Optional list to search within
             
-            if place_norm > 0:
-                # Cosine similarity
-                similarity = np.dot(ref_vec, place_vec) / (ref_norm * place_norm)
-                similarities.append((pid, float(similarity)))
+        Returns:
+            Dict mapping each reference place_id to its (place_id, similarity) list
+        """
+        results: Dict[str, List[tuple]] = {place_id: [] for place_id in place_ids}
+        if not self.is_trained or not results:
+            return results
+        
+        # Known references with a non-zero embedding
+        ref_ids = [
+            place_id for place_id in results
+            if place_id in self.place_to_idx and self._place_has_norm[self.place_to_idx[place_id]]
+        ]
+        if not ref_ids:
+            return results
+        ref_idx = np.fromiter(
+            (self.place_to_idx[place_id] for place_id in ref_ids), dtype=np.int64, count=len(ref_ids)
+        )
         
-        # Sort by similarity
-        similarities.sort(key=lambda x: x[1], reverse=True)
+        # Determine search space
+        if candidate_places:
+            search_idx = self._candidate_rows(candidate_places)
+            search_idx = search_idx[search_idx >= 0]
+        else:
+            search_idx = np.arange(len(self.place_to_idx), dtype=np.int64)
+        search_idx = search_idx[self._place_has_norm[search_idx]]
+        if len(search_idx) == 0:
+            return results
+        
+        # (n_search, n_refs) cosine similarities in a single GEMM
+        sims = self.place_codes[search_idx].astype(np.float32) @ self.place_codes[ref_idx].astype(np.float32).T
+        sims /= np.outer(self._place_code_norms[search_idx], self._place_code_norms[ref_idx])
         
-        return similarities[:k]
+        # A place is not similar to itself
+        sims[search_idx[:, None] == ref_idx[None, :]] = -np.inf
+        
+        # Top-k per reference column: O(n) partition, then sort only the winners
+        if k < len(search_idx):
+            top = np.argpartition(-sims, k, axis=0)[:k]
+        else:
+            top = np.broadcast_to(np.arange(len(search_idx))[:, None], sims.shape)
+        top_sims = np.take_along_axis(sims, top, axis=0)
+        order = np.argsort(-top_sims, axis=0, kind='stable')
+        top = np.take_along_axis(top, order, axis=0)
+        top_sims = np.take_along_axis(top_sims, order, axis=0)
+        
+        for j, place_id in enumerate(ref_ids):
+            valid = np.isfinite(top_sims[:, j])
+            results[place_id] = list(zip(
+                self.idx_to_place_arr[search_idx[top[valid, j]]].tolist(),
+                top_sims[valid, j].tolist()
+            ))
+        
+        return results
+    
+    # Persisted model files (arrays as .npy so they can be memory-mapped)
+    MODEL_ARRAYS = ("user_embeddings", "place_codes", "place_scales", "sigma")
+    MODEL_META_FILE = "collaborative_svd_meta.json"
+    
+    def _array_file(self, name: str) -> Path:
+        """Path of a persisted model array"""
+        return self.model_dir / f"collaborative_svd_{name}.npy"
     
     def _save_model(self):
         """Save trained model to disk"""
@@ -351,24 +516,22 @@ class CollaborativeFilterSVD:
             logger.warning("Model not trained, nothing to save")
             return
         
-        model_file = self.model_dir / "collaborative_svd_model.pkl"
+        meta_file = self.model_dir / self.MODEL_META_FILE
         
-        model_data = {
-            'user_embeddings': self.user_embeddings,
-            'place_embeddings': self.place_embeddings,
-            'sigma': self.sigma,
-            'user_to_idx': self.user_to_idx,
-            'idx_to_user': self.idx_to_user,
-            'place_to_idx': self.place_to_idx,
-            'idx_to_place': self.idx_to_place,
+        # Ids in index order; the forward mappings are rebuilt from these
+        meta = {
+            'users': self.idx_to_user_arr.tolist(),
+            'places': self.idx_to_place_arr.tolist(),
             'global_mean_rating': self.global_mean_rating,
             'n_factors': self.n_factors
         }
         
         try:
-            with open(model_file, 'wb') as f:
-                pickle.dump(model_data, f)
-            logger.info(f"Model saved to {model_file}")
+            for name in self.MODEL_ARRAYS:
+                np.save(self._array_file(name), getattr(self, name))
+            with open(meta_file, 'w', encoding='utf-8') as f:
+                json.dump(meta, f)
+            logger.info(f"Model saved to {self.model_dir}")
         except Exception as e:
             logger.error(f"Failed to save model: {e}")
     
@@ -376,32 +539,38 @@ class CollaborativeFilterSVD:
         """
         Load trained model from disk
         
+        Embedding arrays are memory-mapped (read-only), so pages are read
+        lazily on first access and shared between worker processes.
+        
         Returns:
             True if loaded successfully, False otherwise
         """
-        model_file = self.model_dir / "collaborative_svd_model.pkl"
+        meta_file = self.model_dir / self.MODEL_META_FILE
         
-        if not model_file.exists():
-            logger.warning(f"Model file not found: {model_file}")
+        if not meta_file.exists():
+            logger.warning(f"Model file not found: {meta_file}")
             return False
         
         try:
-            with open(model_file, 'rb') as f:
-                model_data = pickle.load(f)
+            with open(meta_file, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            
+            for name in self.MODEL_ARRAYS:
+                setattr(self, name, np.load(self._array_file(name), mmap_mode='r'))
             
-            self.user_embeddings = model_data['user_embeddings']
-            self.place_embeddings = model_data['place_embeddings']
-            self.sigma = model_data['sigma']
-            self.user_to_idx = model_data['user_to_idx']
-            self.idx_to_user = model_data['idx_to_user']
-            self.place_to_idx = model_data['place_to_idx']
-            self.idx_to_place = model_data['idx_to_place']
-            self.global_mean_rating = model_data['global_mean_rating']
-            self.n_factors = model_data['n_factors']
+            users = meta['users']
+            places = meta['places']
+            self.user_to_idx = dict(zip(users, range(len(users))))
+            self.idx_to_user_arr = np.array(users, dtype=object)
+            self.place_to_idx = dict(zip(places, range(len(places))))
+            self.idx_to_place_arr = np.array(places, dtype=object)
+            self.global_mean_rating = meta['global_mean_rating']
+            self.n_factors = meta['n_factors']
+            self._index_place_codes()
             
             self.is_trained = True
             
-            logger.info(f"Model loaded from {model_file}")
+            logger.info(f"Model loaded from {self.model_dir}")
             logger.info(f"Users: {len(self.user_to_idx)}, Places: {len(self.place_to_idx)}")
             
             return True
@@ -4,7 +4,8 @@ Handles environment variables and system-wide settings
 """
 
 import os
-from typing import Dict, Any, List
+from functools import cached_property
+from typing import Dict, Any, List, Tuple, FrozenSet
 from dotenv import load_dotenv
 from datetime import time, datetime, timedelta
 from dataclasses import dataclass
@@ -23,6 +24,9 @@ class Config:
     # MongoDB Settings
     MONGODB_URI: str = os.getenv("MONGODB_URI", "mongodb://localhost:27017/")
     MONGODB_DATABASE: str = os.getenv("MONGODB_DATABASE", "smart_travel")
+    MONGODB_MAX_POOL_SIZE: int = int(os.getenv("MONGODB_MAX_POOL_SIZE", "50"))
+    MONGODB_MIN_POOL_SIZE: int = int(os.getenv("MONGODB_MIN_POOL_SIZE", "5"))
+    MONGODB_MAX_IDLE_TIME_MS: int = int(os.getenv("MONGODB_MAX_IDLE_TIME_MS", "30000"))
     
     # API Settings
     RAPIDAPI_KEY: str = os.getenv("RAPIDAPI_KEY", "")
@@ -38,6 +42,17 @@ class Config:
     DEFAULT_ALPHA: float = float(os.getenv("DEFAULT_ALPHA", "0.7"))
     DEFAULT_BETA: float = float(os.getenv("DEFAULT_BETA", "0.5"))
     TOP_K_PLACES: int = int(os.getenv("TOP_K_PLACES", "50"))
+    
+    # BERT inference backend: "onnx" (int8 ONNX Runtime) or "torch" (sentence-transformers)
+    BERT_BACKEND: str = os.getenv("BERT_BACKEND", "onnx").lower()
+    BERT_ONNX_DIR: str = os.getenv("BERT_ONNX_DIR", "data/models/onnx")
+    BERT_ONNX_THREADS: int = int(os.getenv("BERT_ONNX_THREADS", "1"))
+    # Place texts ("types name city") are short; a tight token limit keeps
+    # padded attention cheap. Batch size is for bulk precomputation.
+    BERT_MAX_SEQ_LENGTH: int = int(os.getenv("BERT_MAX_SEQ_LENGTH", "64"))
+    BERT_BATCH_SIZE: int = int(os.getenv("BERT_BATCH_SIZE", "128"))
+    # "cpu", "cuda" or "auto" (cuda if available); on cuda the torch model runs in fp16
+    BERT_DEVICE: str = os.getenv("BERT_DEVICE", "cpu").lower()
 
 
 # ============================================================================
@@ -96,6 +111,20 @@ class TimeBlock:
         """Get available hours minus buffer"""
         return self.get_duration_hours() - (self.buffer_minutes / 60)
     
+    @cached_property
+    def available_hours(self) -> float:
+        """Available hours minus buffer (computed once per block)"""
+        return self.get_available_hours()
+    
+    @cached_property
+    def hour_bounds(self) -> Tuple[float, float]:
+        """(start, end) in hours since midnight, end past 24 for overnight blocks (computed once)"""
+        start_h = self.start_time.hour + self.start_time.minute / 60 + self.start_time.second / 3600
+        end_h = self.end_time.hour + self.end_time.minute / 60 + self.end_time.second / 3600
+        if self.end_time < self.start_time:  # Overnight
+            end_h += 24
+        return start_h, end_h
+    
     def is_time_in_block(self, check_time: time) -> bool:
         """Check if a time falls within this block"""
         if self.start_time <= self.end_time:
@@ -182,7 +211,7 @@ class TimeBlockConfig:
     }
     
     # Daily schedule order
-    DAILY_SCHEDULE = [
+    DAILY_SCHEDULE = (
         BlockType.BREAKFAST,
         BlockType.MORNING,
         BlockType.LUNCH,
@@ -190,7 +219,14 @@ class TimeBlockConfig:
         BlockType.DINNER,
         BlockType.EVENING,
         BlockType.HOTEL
-    ]
+    )
+    
+    # Block kinds
+    MEAL_BLOCKS = frozenset((BlockType.BREAKFAST, BlockType.LUNCH, BlockType.DINNER))
+    ACTIVITY_BLOCKS = frozenset((BlockType.MORNING, BlockType.AFTERNOON, BlockType.EVENING))
+    
+    # Allowed place types per block, filled in below the class from BLOCKS
+    BLOCK_PLACE_TYPES: Dict[BlockType, FrozenSet[str]] = {}
     
     # Place type mappings
     PLACE_TYPE_MAPPING = {
@@ -233,23 +269,19 @@ class TimeBlockConfig:
         return cls.PLACE_TYPE_MAPPING.get(category, [])
     
     @classmethod
-    def get_place_types_for_block(cls, block_type: BlockType) -> List[str]:
-        """Get all allowed place types for a block"""
-        block = cls.BLOCKS[block_type]
-        all_types = []
-        for category in block.place_categories:
-            all_types.extend(cls.get_place_types_for_category(category))
-        return list(set(all_types))  # Remove duplicates
+    def get_place_types_for_block(cls, block_type: BlockType) -> FrozenSet[str]:
+        """Get all allowed place types for a block (precomputed set)"""
+        return cls.BLOCK_PLACE_TYPES[block_type]
     
     @classmethod
     def is_meal_block(cls, block_type: BlockType) -> bool:
         """Check if block is a meal"""
-        return block_type in [BlockType.BREAKFAST, BlockType.LUNCH, BlockType.DINNER]
+        return block_type in cls.MEAL_BLOCKS
     
     @classmethod
     def is_activity_block(cls, block_type: BlockType) -> bool:
         """Check if block is an activity"""
-        return block_type in [BlockType.MORNING, BlockType.AFTERNOON, BlockType.EVENING]
+        return block_type in cls.ACTIVITY_BLOCKS
     
     @classmethod
     def is_rest_block(cls, block_type: BlockType) -> bool:
@@ -299,5 +331,17 @@ class TimeBlockConfig:
         }
 
 
+# Allowed place types per block, built once (class-body comprehensions can't see BLOCKS);
+# lowercase, so PlaceFilter.filter_by_types can use them as they are
+TimeBlockConfig.BLOCK_PLACE_TYPES = {
+    block_type: frozenset(
+        place_type.lower()
+        for category in block.place_categories
+        for place_type in TimeBlockConfig.PLACE_TYPE_MAPPING.get(category, [])
+    )
+    for block_type, block in TimeBlockConfig.BLOCKS.items()
+}
+
+
 # Create singleton instance
 config = Config()
@@ -5,17 +5,40 @@ Optimized with embedding cache to minimize inference time
 """
 
 import numpy as np
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterator, Mapping
 import logging
-import pickle
+import json
 import os
+import tempfile
+import threading
 from pathlib import Path
 
 from .models import Place, UserPreference
+from .config import config
 
 logger = logging.getLogger(__name__)
 
 
+class _EmbeddingCacheView(Mapping):
+    """Read-only place_id -> embedding view over the stacked embedding matrix"""
+    
+    def __init__(self, owner: "ContentBasedFilterBERT"):
+        self._owner = owner
+    
+    def __getitem__(self, place_id: str) -> np.ndarray:
+        with self._owner._lock:
+            return self._owner._emb_matrix[self._owner._id_to_row[place_id]]
+    
+    def __contains__(self, place_id) -> bool:
+        return place_id in self._owner._id_to_row
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._owner._id_to_row)
+    
+    def __len__(self) -> int:
+        return len(self._owner._id_to_row)
+
+
 class ContentBasedFilterBERT:
     """
     Content-based filtering using Multilingual BERT embeddings
@@ -27,18 +50,52 @@ class ContentBasedFilterBERT:
     - 768-dimensional dense vectors
     """
     
-    def __init__(self, cache_dir: str = "data/embeddings_cache"):
+    EMBEDDING_DIM = 768
+    # Storage precision of cached embeddings; unit vectors lose nothing that
+    # matters for ranking in float16 and take half the RAM/disk of float32
+    EMBEDDING_DTYPE = np.float16
+    MODEL_NAME = 'paraphrase-multilingual-mpnet-base-v2'
+    
+    def __init__(self, cache_dir: str = "data/embeddings_cache", batch_size: int = config.BERT_BATCH_SIZE):
         """
         Initialize content-based filter with BERT
         
         Args:
             cache_dir: Directory to store/load embedding cache
+            batch_size: Texts per forward pass when precomputing embeddings
         """
         self.model = None
-        self.embedding_cache: Dict[str, np.ndarray] = {}
+        self.batch_size = batch_size
+        
+        # All cached embeddings stacked in one float16 matrix (capacity grows
+        # by doubling); row self._id_to_row[place_id] holds that place, and
+        # the dict's insertion order is the row order
+        self._emb_matrix = np.zeros((0, self.EMBEDDING_DIM), dtype=self.EMBEDDING_DTYPE)
+        self._id_to_row: Dict[str, int] = {}
+        
+        # One shared instance serves threadpool threads (e.g. concurrent city
+        # loads): every read and append of the matrix/row map happens under
+        # this lock. It is never held while encoding or writing the cache, so
+        # readers don't wait for a cold city's BERT pass.
+        self._lock = threading.Lock()
+        # Serializes model loading, and cache writes so the last file written
+        # holds the newest snapshot
+        self._model_lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.cache_file = self.cache_dir / "place_embeddings.pkl"
+        # Matrix as .npy (memory-mapped on load) + JSON with the place ids in
+        # row order and the row count they were written for
+        self.cache_file = self.cache_dir / "place_embeddings.npy"
+        self.ids_file = self.cache_dir / "place_embedding_ids.json"
+        
+        # Encoder the cached vectors come from, stored in the ids JSON:
+        # vectors of another backend/model/quantization aren't comparable,
+        # so a cache written by a different encoder is ignored
+        device = self._resolve_device()
+        backend = "onnx" if config.BERT_BACKEND == "onnx" and device == "cpu" else "torch"
+        self._encoder = self._encoder_info(backend, device)
         
         # Load model lazily (only when needed)
         self._model_loaded = False
@@ -47,18 +104,47 @@ class ContentBasedFilterBERT:
         self._load_cache()
         
         logger.info(f"ContentBasedFilterBERT initialized with cache dir: {cache_dir}")
-        logger.info(f"Loaded {len(self.embedding_cache)} cached embeddings")
+        logger.info(f"Loaded {len(self._id_to_row)} cached embeddings")
     
     def _load_model(self):
         """Lazy load sentence-transformers model"""
         if self._model_loaded:
             return
         
+        with self._model_lock:
+            if not self._model_loaded:
+                self._load_model_locked()
+    
+    def _load_model_locked(self):
+        """Load the model (caller must hold self._model_lock)"""
+        device = self._resolve_device()
+        
+        # On a GPU fp16 torch beats the int8 CPU ONNX model
+        if config.BERT_BACKEND == "onnx" and device == "cpu":
+            try:
+                from .onnx_embedder import get_onnx_embedder
+                
+                logger.info("Loading multilingual BERT model (ONNX Runtime, int8)...")
+                self.model = get_onnx_embedder()
+                self._use_encoder(self._encoder_info("onnx", device))
+                self._model_loaded = True
+                logger.info("Model loaded successfully (768 dimensions)")
+                return
+                
+            except ImportError as e:
+                logger.warning(f"ONNX backend unavailable ({e}), falling back to sentence-transformers")
+            except Exception as e:
+                logger.warning(f"Failed to load ONNX model: {e}. Falling back to sentence-transformers")
+        
         try:
             from sentence_transformers import SentenceTransformer
             
-            logger.info("Loading multilingual BERT model (paraphrase-multilingual-mpnet-base-v2)...")
-            self.model = SentenceTransformer('paraphrase-multilingual-mpnet-base-v2')
+            logger.info(f"Loading multilingual BERT model ({self.MODEL_NAME}) on {device}...")
+            self.model = SentenceTransformer(self.MODEL_NAME, device=device)
+            self.model.max_seq_length = config.BERT_MAX_SEQ_LENGTH
+            if device == "cuda":
+                self.model.half()  # fp16 tensor-core GEMMs; outputs are cast for storage
+            self._use_encoder(self._encoder_info("torch", device))
             self._model_loaded = True
             logger.info("Model loaded successfully (768 dimensions)")
             
@@ -69,27 +155,150 @@ class ContentBasedFilterBERT:
             logger.error(f"Failed to load BERT model: {e}")
             raise
     
+    @classmethod
+    def _encoder_info(cls, backend: str, device: str) -> Dict:
+        """Settings of the encoder that determine the embedding values"""
+        if backend == "onnx":
+            quantization = "int8"
+        else:
+            quantization = "fp16" if device == "cuda" else "fp32"
+        return {
+            'model': cls.MODEL_NAME,
+            'backend': backend,
+            'quantization': quantization,
+            'max_seq_length': config.BERT_MAX_SEQ_LENGTH
+        }
+    
+    def _use_encoder(self, encoder: Dict):
+        """Record the loaded encoder, dropping cached embeddings another encoder made"""
+        with self._lock:
+            if encoder == self._encoder:
+                return
+            if self._id_to_row:
+                logger.warning(
+                    f"Discarding {len(self._id_to_row)} cached embeddings from "
+                    f"{self._encoder['backend']} ({self._encoder['quantization']}), "
+                    f"loaded {encoder['backend']} ({encoder['quantization']})"
+                )
+            self._reset_embeddings()
+            self._encoder = encoder
+    
+    def _reset_embeddings(self):
+        """Empty the in-memory embedding matrix"""
+        self._emb_matrix = np.zeros((0, self.EMBEDDING_DIM), dtype=self.EMBEDDING_DTYPE)
+        self._id_to_row = {}
+    
+    @property
+    def embedding_cache(self) -> Mapping[str, np.ndarray]:
+        """Cached embeddings by place_id (read-only view, rows are float16)"""
+        return _EmbeddingCacheView(self)
+    
+    @staticmethod
+    def _resolve_device() -> str:
+        """Device for the torch model from BERT_DEVICE ("cpu", "cuda" or "auto")"""
+        if config.BERT_DEVICE == "cpu":
+            return "cpu"
+        
+        try:
+            import torch
+            if torch.cuda.is_available():
+                return "cuda"
+        except ImportError:
+            pass
+        
+        if config.BERT_DEVICE == "cuda":
+            logger.warning("BERT_DEVICE=cuda but no GPU is available, using cpu")
+        return "cpu"
+    
     def _load_cache(self):
-        """Load embedding cache from disk"""
-        if self.cache_file.exists():
+        """Load embedding cache from disk (matrix is memory-mapped, not read)"""
+        if self.cache_file.exists() and self.ids_file.exists():
             try:
-                with open(self.cache_file, 'rb') as f:
-                    self.embedding_cache = pickle.load(f)
-                logger.info(f"Loaded {len(self.embedding_cache)} embeddings from cache")
+                with open(self.ids_file, 'r', encoding='utf-8') as f:
+                    meta = json.load(f)
+                if meta.get('encoder') != self._encoder:
+                    logger.info(f"Ignoring embedding cache from a different encoder: {meta.get('encoder')}")
+                    return
+                place_ids = meta['ids']
+                matrix = np.load(self.cache_file, mmap_mode='r')
+                
+                # Both files are replaced separately, so a crash in between
+                # leaves a pair that doesn't match: discard it
+                if not (meta['rows'] == len(place_ids) == matrix.shape[0]) or matrix.shape[1] != self.EMBEDDING_DIM:
+                    raise ValueError(
+                        f"matrix shape {matrix.shape} does not match {meta['rows']} rows / {len(place_ids)} ids"
+                    )
+                
+                # Read-only map; the first append copies it into a growable buffer
+                self._emb_matrix = matrix
+                self._id_to_row = dict(zip(place_ids, range(len(place_ids))))
+                logger.info(f"Loaded {len(self._id_to_row)} embeddings from cache")
             except Exception as e:
                 logger.warning(f"Failed to load cache: {e}")
-                self.embedding_cache = {}
+                self._reset_embeddings()
         else:
             logger.info("No cache file found, starting fresh")
     
     def _save_cache(self):
         """Save embedding cache to disk"""
+        with self._save_lock:
+            # Rows are only ever appended, so this view stays valid unlocked
+            with self._lock:
+                n_rows = len(self._id_to_row)
+                matrix = self._emb_matrix[:n_rows]
+                meta = {'rows': n_rows, 'encoder': self._encoder, 'ids': list(self._id_to_row)}
+            
+            self._write_cache(matrix, meta)
+    
+    def _write_cache(self, matrix: np.ndarray, meta: Dict):
+        """Write a snapshot of the cache files"""
+        n_rows = meta['rows']
+        
+        # Write to per-writer temp files and swap them in: other threads or
+        # workers may be saving too, and the current files may be
+        # memory-mapped by this or another process
+        tmp_paths = []
         try:
-            with open(self.cache_file, 'wb') as f:
-                pickle.dump(self.embedding_cache, f)
-            logger.info(f"Saved {len(self.embedding_cache)} embeddings to cache")
+            with tempfile.NamedTemporaryFile(dir=self.cache_dir, suffix=".npy.tmp", delete=False) as f:
+                tmp_paths.append(f.name)
+                np.save(f, matrix)
+            with tempfile.NamedTemporaryFile(
+                'w', dir=self.cache_dir, suffix=".json.tmp", encoding='utf-8', delete=False
+            ) as f:
+                tmp_paths.append(f.name)
+                json.dump(meta, f, ensure_ascii=False)
+            
+            os.replace(tmp_paths[0], self.cache_file)
+            os.replace(tmp_paths[1], self.ids_file)
+            logger.info(f"Saved {n_rows} embeddings to cache")
         except Exception as e:
             logger.error(f"Failed to save cache: {e}")
+            for path in tmp_paths:
+                if os.path.exists(path):
+                    os.unlink(path)
+    
+    def _append_rows(self, place_ids: List[str], embeddings) -> None:
+        """
+        Append embeddings to the stacked matrix (ids must not be cached yet)
+        
+        Caller must hold self._lock.
+        
+        Args:
+            place_ids: Place IDs
+            embeddings: (n, 768) array or list of (768,) vectors, aligned with place_ids
+        """
+        if not place_ids:
+            return
+        
+        n_rows = len(self._id_to_row)
+        needed = n_rows + len(place_ids)
+        if needed > len(self._emb_matrix):
+            grown = np.zeros((max(needed, 2 * len(self._emb_matrix)), self.EMBEDDING_DIM), dtype=self.EMBEDDING_DTYPE)
+            grown[:n_rows] = self._emb_matrix[:n_rows]
+            self._emb_matrix = grown
+        
+        self._emb_matrix[n_rows:needed] = np.asarray(embeddings, dtype=self.EMBEDDING_DTYPE)
+        self._id_to_row.update(zip(place_ids, range(n_rows, needed)))
     
     def _create_place_text(self, place: Place) -> str:
         """
@@ -140,8 +349,11 @@ class ContentBasedFilterBERT:
             Embedding vector (768 dimensions)
         """
         # Check cache first
-        if use_cache and place.place_id in self.embedding_cache:
-            return self.embedding_cache[place.place_id]
+        if use_cache:
+            with self._lock:
+                row = self._id_to_row.get(place.place_id)
+                if row is not None:
+                    return self._emb_matrix[row]
         
         # Load model if not loaded
         self._load_model()
@@ -149,21 +361,29 @@ class ContentBasedFilterBERT:
         # Create text representation
         text = self._create_place_text(place)
         
-        # Encode with BERT
+        # Encode with BERT (without holding the lock)
         embedding = self.model.encode(
             text,
             convert_to_numpy=True,
             show_progress_bar=False,
             normalize_embeddings=True  # L2 normalization for cosine similarity
-        )
+        ).astype(self.EMBEDDING_DTYPE)
         
-        # Cache the embedding
+        # Cache the embedding (unless another thread got there first)
         if use_cache:
-            self.embedding_cache[place.place_id] = embedding
+            with self._lock:
+                if place.place_id not in self._id_to_row:
+                    self._append_rows([place.place_id], embedding[None, :])
         
         return embedding
     
-    def precompute_embeddings(self, places: List[Place], save_cache: bool = True):
+    def precompute_embeddings(
+        self,
+        places: List[Place],
+        save_cache: bool = True,
+        use_multiprocess: bool = False,
+        num_processes: Optional[int] = None
+    ):
         """
         Precompute embeddings for all places (batch processing)
         
@@ -173,12 +393,17 @@ class ContentBasedFilterBERT:
         Args:
             places: List of all places
             save_cache: Whether to save cache to disk after computation
+            use_multiprocess: Encode with a sentence-transformers process pool
+                              (initial indexing of large catalogues)
+            num_processes: CPU worker processes for the pool (default: all cores);
+                           on GPU one process per device is used
         """
         # Load model
         self._load_model()
         
         # Find places not in cache
-        places_to_encode = [p for p in places if p.place_id not in self.embedding_cache]
+        with self._lock:
+            places_to_encode = [p for p in places if p.place_id not in self._id_to_row]
         
         if not places_to_encode:
             logger.info("All places already in cache")
@@ -186,21 +411,34 @@ class ContentBasedFilterBERT:
         
         logger.info(f"Encoding {len(places_to_encode)} new places...")
         
-        # Batch encode for efficiency
+        # Batch encode for efficiency (without holding the lock, so lookups
+        # of cached places go on meanwhile)
         texts = [self._create_place_text(p) for p in places_to_encode]
         
-        # Encode in batch (much faster than one-by-one)
-        embeddings = self.model.encode(
-            texts,
-            convert_to_numpy=True,
-            show_progress_bar=True,
-            normalize_embeddings=True,
-            batch_size=32  # Adjust based on available memory
-        )
-        
-        # Update cache
-        for place, embedding in zip(places_to_encode, embeddings):
-            self.embedding_cache[place.place_id] = embedding
+        if use_multiprocess and hasattr(self.model, "start_multi_process_pool"):
+            embeddings = self._encode_multi_process(texts, num_processes)
+        else:
+            if use_multiprocess:
+                logger.info("Multi-process encoding needs the sentence-transformers backend, encoding in-process")
+            
+            # Encode in batch (much faster than one-by-one)
+            embeddings = self.model.encode(
+                texts,
+                convert_to_numpy=True,
+                show_progress_bar=True,
+                normalize_embeddings=True,
+                batch_size=self.batch_size  # Texts are short, so large batches stay cheap
+            )
+        embeddings = embeddings.astype(self.EMBEDDING_DTYPE)
+        
+        # Update cache: only the first copy of repeated places, and only places
+        # another thread hasn't cached while these were encoding
+        with self._lock:
+            first = {}
+            for i, place in enumerate(places_to_encode):
+                if place.place_id not in self._id_to_row:
+                    first.setdefault(place.place_id, i)
+            self._append_rows(list(first), embeddings[list(first.values())])
         
         logger.info(f"Encoded {len(places_to_encode)} places successfully")
         
@@ -208,6 +446,21 @@ class ContentBasedFilterBERT:
         if save_cache:
             self._save_cache()
     
+    def _encode_multi_process(self, texts: List[str], num_processes: Optional[int]) -> np.ndarray:
+        """Encode texts across a sentence-transformers process pool (L2-normalized)"""
+        target_devices = None  # All GPUs when on cuda
+        if self.model.device.type == "cpu":
+            target_devices = ["cpu"] * (num_processes or os.cpu_count() or 1)
+        
+        pool = self.model.start_multi_process_pool(target_devices=target_devices)
+        try:
+            embeddings = self.model.encode_multi_process(texts, pool, batch_size=self.batch_size)
+        finally:
+            self.model.stop_multi_process_pool(pool)
+        
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        return embeddings / np.clip(norms, 1e-12, None)
+    
     def _create_user_embedding(
         self,
         user_pref: UserPreference,
@@ -230,37 +483,64 @@ class ContentBasedFilterBERT:
             # Collaborative filtering will handle this case
             return np.zeros(768)
         
-        # Get embeddings for selected places
-        selected_embeddings = [
-            self._create_place_embedding(place) 
-            for place in selected_places
-        ]
+        # Batch-encode selected places that aren't cached yet
+        with self._lock:
+            missing = [p for p in selected_places if p.place_id not in self._id_to_row]
+        if missing:
+            self.precompute_embeddings(missing, save_cache=False)
         
-        # Average pooling
-        user_embedding = np.mean(selected_embeddings, axis=0)
+        with self._lock:
+            rows = [self._id_to_row[p.place_id] for p in selected_places]
+            
+            # Average pooling over one gathered slab (in float32, rows are float16)
+            user_embedding = self._emb_matrix[rows].mean(axis=0, dtype=np.float32)
         
         # Normalize
         norm = np.linalg.norm(user_embedding)
         if norm > 0:
-            user_embedding = user_embedding / norm
+            user_embedding /= norm
         
         return user_embedding
     
+    def get_embedding_matrix(self, places: List[Place]) -> np.ndarray:
+        """
+        Gather place embeddings into an (n, 768) C-contiguous float32 matrix
+        
+        Places missing from the cache are batch-encoded first. Rows are
+        upcast from float16 during the gather, since numpy has no float16
+        BLAS path and float16 matmuls would run as slow scalar loops.
+        """
+        with self._lock:
+            missing = [p for p in places if p.place_id not in self._id_to_row]
+        if missing:
+            self.precompute_embeddings(missing, save_cache=False)
+        
+        with self._lock:
+            rows = np.fromiter(
+                (self._id_to_row[p.place_id] for p in places), dtype=np.int64, count=len(places)
+            )
+            
+            # One fancy-index gather out of the stacked matrix
+            return self._emb_matrix[rows].astype(np.float32)
+    
     def calculate_content_scores(
         self,
         user_pref: UserPreference,
         candidate_places: List[Place],
-        selected_places: List[Place]
+        selected_places: List[Place],
+        candidate_embeddings: Optional[np.ndarray] = None
     ) -> Dict[str, float]:
         """
         Calculate content-based scores for candidate places
         
-        Uses cosine similarity between user embedding and place embeddings
+        Uses cosine similarity between user embedding and place embeddings,
+        computed for all candidates with a single matrix-vector product
         
         Args:
             user_pref: User preferences
             candidate_places: Places to score
             selected_places: Places user has selected
+            candidate_embeddings: Optional cached (n, 768) matrix aligned with candidate_places
             
         Returns:
             Dict mapping place_id to content score [0, 1]
@@ -273,56 +553,57 @@ class ContentBasedFilterBERT:
             logger.warning("Cold start: no selected places, returning neutral scores")
             return {place.place_id: 0.5 for place in candidate_places}
         
-        # Calculate scores
-        scores = {}
+        # Place embedding matrix (from city cache if available)
+        if candidate_embeddings is None or len(candidate_embeddings) != len(candidate_places):
+            candidate_embeddings = self.get_embedding_matrix(candidate_places)
         
-        for place in candidate_places:
-            # Skip if already selected
-            if place.place_id in [p.place_id for p in selected_places]:
-                continue
-            
-            # Get place embedding (from cache if available)
-            place_embedding = self._create_place_embedding(place, use_cache=True)
-            
-            # Cosine similarity (already normalized, so just dot product)
-            # Since embeddings are normalized, dot product = cosine similarity
-            similarity = np.dot(user_embedding, place_embedding)
-            
-            # Convert from [-1, 1] to [0, 1]
-            # In practice, with normalized embeddings, similarity is usually in [0, 1]
-            # But we clip to be safe
-            score = np.clip((similarity + 1) / 2, 0, 1)
-            
-            # Add small rating boost (places with higher ratings get slight preference)
-            rating_boost = (place.rating / 5.0) * 0.1  # Max 0.1 boost
-            
-            # Final score
-            final_score = min(1.0, score + rating_boost)
-            
-            scores[place.place_id] = float(final_score)
+        # Cosine similarity (embeddings are normalized, so just dot product)
+        similarities = candidate_embeddings @ user_embedding.astype(np.float32)
+        
+        # Convert from [-1, 1] to [0, 1]
+        # In practice, with normalized embeddings, similarity is usually in [0, 1]
+        # But we clip to be safe
+        content = np.clip((similarities + 1) / 2, 0, 1)
+        
+        # Add small rating boost (places with higher ratings get slight preference)
+        ratings = np.fromiter((p.rating for p in candidate_places), dtype=np.float64, count=len(candidate_places))
+        final_scores = np.minimum(1.0, content + (ratings / 5.0) * 0.1)  # Max 0.1 boost
+        
+        # Skip places already selected (one O(1) set check per candidate)
+        selected_ids = {p.place_id for p in selected_places}
+        keep = np.fromiter(
+            (p.place_id not in selected_ids for p in candidate_places), dtype=bool, count=len(candidate_places)
+        )
+        kept_scores = final_scores[keep]
+        scores = dict(zip(
+            (p.place_id for p, k in zip(candidate_places, keep.tolist()) if k),
+            kept_scores.tolist()
+        ))
         
         logger.info(f"Calculated content scores for {len(scores)} candidate places")
         
         # Log some statistics
-        if scores:
-            avg_score = np.mean(list(scores.values()))
-            max_score = max(scores.values())
-            min_score = min(scores.values())
-            logger.info(f"Score stats - avg: {avg_score:.3f}, min: {min_score:.3f}, max: {max_score:.3f}")
+        if len(kept_scores):
+            logger.info(
+                f"Score stats - avg: {kept_scores.mean():.3f}, "
+                f"min: {kept_scores.min():.3f}, max: {kept_scores.max():.3f}"
+            )
         
         return scores
     
     def clear_cache(self):
         """Clear embedding cache (useful for testing or updates)"""
-        self.embedding_cache = {}
-        if self.cache_file.exists():
-            self.cache_file.unlink()
+        with self._lock:
+            self._reset_embeddings()
+            for path in (self.cache_file, self.ids_file):
+                if path.exists():
+                    path.unlink()
         logger.info("Embedding cache cleared")
     
     def get_cache_stats(self) -> Dict:
         """Get cache statistics"""
         return {
-            'cached_embeddings': len(self.embedding_cache),
+            'cached_embeddings': len(self._id_to_row),
             'cache_file_exists': self.cache_file.exists(),
             'cache_dir': str(self.cache_dir),
             'model_loaded': self._model_loaded
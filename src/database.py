@@ -3,6 +3,7 @@ Database module for MongoDB connection and operations
 Handles all database interactions for the Smart Travel system
 """
 
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 from pymongo import MongoClient
 from pymongo.collection import Collection
@@ -11,6 +12,7 @@ from bson import ObjectId
 import logging
 
 from .config import config
+from .models import PLACE_PROJECTION
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -19,16 +21,22 @@ logger = logging.getLogger(__name__)
 class MongoDBHandler:
     """Handler for MongoDB operations"""
     
-    def __init__(self):
-        """Initialize MongoDB connection"""
+    def __init__(self, **client_options: Any):
+        """
+        Initialize MongoDB connection
+        
+        Args:
+            **client_options: Extra MongoClient options (e.g. maxPoolSize, minPoolSize)
+        """
         self.client: Optional[MongoClient] = None
         self.db: Optional[Database] = None
+        self.client_options = client_options
         self.connect()
     
     def connect(self) -> None:
         """Establish connection to MongoDB"""
         try:
-            self.client = MongoClient(config.MONGODB_URI)
+            self.client = MongoClient(config.MONGODB_URI, **self.client_options)
             self.db = self.client[config.MONGODB_DATABASE]
             # Test connection
             self.client.server_info()
@@ -158,22 +166,22 @@ class MongoDBHandler:
             List of user-place interaction documents
         """
         collection = self.get_collection("tours")
-        interactions = []
         
-        for tour in collection.find():
-            # Extract user preferences and selected places
-            if "participants" in tour and "itinerary" in tour:
-                for participant_id in tour["participants"]:
-                    for day in tour["itinerary"]:
-                        for place in day.get("places", []):
-                            interactions.append({
-                                "user_id": str(participant_id),
-                                "place_id": place.get("place_id"),
-                                "rating": place.get("rating", 0),
-                                "tour_id": tour.get("tour_id")
-                            })
+        # Flatten participants × days × places inside MongoDB
+        pipeline = [
+            {"$unwind": "$participants"},
+            {"$unwind": "$itinerary"},
+            {"$unwind": "$itinerary.places"},
+            {"$project": {
+                "_id": 0,
+                "user_id": {"$toString": "$participants"},
+                "place_id": {"$ifNull": ["$itinerary.places.place_id", None]},
+                "rating": {"$ifNull": ["$itinerary.places.rating", 0]},
+                "tour_id": {"$ifNull": ["$tour_id", None]}
+            }}
+        ]
         
-        return interactions
+        return list(collection.aggregate(pipeline, allowDiskUse=True))
     
     def get_user_selected_places(self, user_id: str) -> List[Dict[str, Any]]:
         """
@@ -193,16 +201,23 @@ class MongoDBHandler:
         if not user_oid:
             return []
         
-        tours = collection.find({"participants": user_oid})
+        # Only stream the place ids of each tour, not whole tour documents
+        tours = collection.find(
+            {"participants": user_oid},
+            projection={"_id": 0, "itinerary.places.place_id": 1}
+        )
         
         for tour in tours:
             for day in tour.get("itinerary", []):
                 for place in day.get("places", []):
                     place_ids.add(place.get("place_id"))
         
-        # Get full place details
+        # Get place details (only the fields a Place is built from)
         places_collection = self.get_collection("places")
-        places = list(places_collection.find({"id": {"$in": list(place_ids)}}))
+        places = list(places_collection.find(
+            {"id": {"$in": list(place_ids)}},
+            projection=PLACE_PROJECTION
+        ))
         
         return places
     
@@ -259,16 +274,15 @@ class MongoDBHandler:
         collection = self.get_collection("user_preferences")
         all_prefs = list(collection.find())
         
-        # Filter: only keep users whose city has places
+        # Filter: only keep users whose city has places (one distinct over
+        # the city index instead of a count round trip per user)
         valid_prefs = []
-        places_collection = self.get_collection("places")
+        cities_with_places = set(self.get_collection("places").distinct("city"))
         
         for pref in all_prefs:
             city_name = pref.get("city_name", "")
             if city_name:
-                # Check if city has any places
-                count = places_collection.count_documents({"city": city_name}, limit=1)
-                if count > 0:
+                if city_name in cities_with_places:
                     valid_prefs.append(pref)
                 else:
                     logger.warning(f"Skipping user {pref.get('user_id')}: city '{city_name}' has no places")
@@ -288,34 +302,27 @@ class MongoDBHandler:
             List of interaction dictionaries
         """
         collection = self.get_collection("tours")
-        interactions = []
-        
-        tours = collection.find()
         
-        for tour in tours:
-            # Get user IDs from participants
-            participants = tour.get("participants", [])
-            if not participants:
-                continue
-            
+        # Flatten days × places inside MongoDB, keeping rated places only
+        pipeline = [
             # Use first participant as the main user for this tour
-            user_oid = participants[0]
-            user_id = str(user_oid) if isinstance(user_oid, ObjectId) else str(user_oid)
-            
-            # Extract places from itinerary
-            itinerary = tour.get("itinerary", [])
-            for day in itinerary:
-                places = day.get("places", [])
-                for place_entry in places:
-                    place_id = place_entry.get("place_id")
-                    rating = place_entry.get("rating", 0.0)
-                    
-                    if place_id and rating > 0:
-                        interactions.append({
-                            "user_id": user_id,
-                            "place_id": place_id,
-                            "rating": float(rating)
-                        })
+            {"$match": {"participants.0": {"$exists": True}}},
+            {"$project": {"user": {"$arrayElemAt": ["$participants", 0]}, "itinerary": 1}},
+            {"$unwind": "$itinerary"},
+            {"$unwind": "$itinerary.places"},
+            {"$match": {
+                "itinerary.places.place_id": {"$nin": [None, ""]},
+                "itinerary.places.rating": {"$gt": 0}
+            }},
+            {"$project": {
+                "_id": 0,
+                "user_id": {"$toString": "$user"},
+                "place_id": "$itinerary.places.place_id",
+                "rating": {"$toDouble": "$itinerary.places.rating"}
+            }}
+        ]
+        
+        interactions = list(collection.aggregate(pipeline, allowDiskUse=True))
         
         logger.info(f"Extracted {len(interactions)} tour interactions for collaborative filter")
         return interactions
@@ -329,8 +336,19 @@ class MongoDBHandler:
         self.disconnect()
 
 
-# Singleton instance
-db_handler = MongoDBHandler()
+@lru_cache(maxsize=1)
+def get_db_handler() -> MongoDBHandler:
+    """
+    Get the shared MongoDB handler
+    
+    Connects on first call rather than at import, and its client's
+    connection pool is reused by every caller in the process.
+    """
+    return MongoDBHandler(
+        maxPoolSize=config.MONGODB_MAX_POOL_SIZE,
+        minPoolSize=config.MONGODB_MIN_POOL_SIZE,
+        maxIdleTimeMS=config.MONGODB_MAX_IDLE_TIME_MS
+    )
 
 
 def get_database() -> Database:
@@ -340,4 +358,4 @@ def get_database() -> Database:
     Returns:
         Database instance for queries
     """
-    return db_handler.db
+    return get_db_handler().db
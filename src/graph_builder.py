@@ -3,42 +3,49 @@ Graph Builder with Dijkstra Algorithm
 Build graph from places and calculate shortest paths using Dijkstra
 """
 
-import heapq
 import logging
 from typing import List, Dict, Tuple, Optional
-from dataclasses import dataclass
 import math
+import numpy as np
 
 from src.models import Place
+from src.routing_kernels import haversine_matrix, dijkstra_dense
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
-class Edge:
-    """Edge in the graph"""
-    to_place_id: str
-    distance_km: float
-    
-
 class PlaceGraph:
     """
     Graph representation of places with Haversine distances
     Supports Dijkstra shortest path algorithm
+    
+    The complete graph is stored as a dense distance matrix (numba kernel);
+    single-source Dijkstra results are memoized per source place.
     """
     
-    def __init__(self, places: List[Place]):
+    def __init__(self, places: List[Place], distance_matrix: Optional[np.ndarray] = None):
         """
         Initialize graph from list of places
         
         Args:
             places: List of Place objects
+            distance_matrix: Optional precomputed Haversine matrix aligned with places
         """
         self.places_dict = {p.place_id: p for p in places}
-        self.adjacency_list: Dict[str, List[Edge]] = {}
+        self.place_ids: List[str] = list(self.places_dict.keys())
+        self.id_to_idx: Dict[str, int] = {pid: i for i, pid in enumerate(self.place_ids)}
+        
+        # Single-source shortest path cache: source idx -> (distances, predecessors)
+        self._sssp_cache: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
         
         logger.info(f"Building graph with {len(places)} places")
-        self._build_graph()
+        
+        if distance_matrix is not None and len(self.place_ids) == len(places) == distance_matrix.shape[0]:
+            self.distance_matrix = distance_matrix
+        else:
+            self._build_graph()
+        
+        logger.info(f"Graph built with {len(self.place_ids)} nodes")
         
     def _haversine_distance(self, lat1: float, lon1: float, 
                            lat2: float, lon2: float) -> float:
@@ -66,31 +73,18 @@ class PlaceGraph:
         return R * c
     
     def _build_graph(self):
-        """Build complete graph with edges between all place pairs"""
-        place_ids = list(self.places_dict.keys())
-        
-        for i, place_id1 in enumerate(place_ids):
-            place1 = self.places_dict[place_id1]
-            self.adjacency_list[place_id1] = []
-            
-            for place_id2 in place_ids:
-                if place_id1 == place_id2:
-                    continue
-                
-                place2 = self.places_dict[place_id2]
-                
-                # Calculate Haversine distance
-                distance = self._haversine_distance(
-                    place1.latitude, place1.longitude,
-                    place2.latitude, place2.longitude
-                )
-                
-                # Add edge
-                self.adjacency_list[place_id1].append(
-                    Edge(to_place_id=place_id2, distance_km=distance)
-                )
-        
-        logger.info(f"Graph built with {len(self.adjacency_list)} nodes")
+        """Build complete graph as a dense distance matrix between all place pairs"""
+        lat = np.array([self.places_dict[pid].latitude for pid in self.place_ids], dtype=np.float64)
+        lng = np.array([self.places_dict[pid].longitude for pid in self.place_ids], dtype=np.float64)
+        self.distance_matrix = haversine_matrix(lat, lng)
+    
+    def _single_source(self, start_idx: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Get (memoized) Dijkstra distances/predecessors from a source"""
+        result = self._sssp_cache.get(start_idx)
+        if result is None:
+            result = dijkstra_dense(self.distance_matrix, start_idx)
+            self._sssp_cache[start_idx] = result
+        return result
     
     def dijkstra(self, start_id: str, end_id: str) -> Tuple[float, List[str]]:
         """
@@ -111,57 +105,25 @@ class PlaceGraph:
         if start_id == end_id:
             return 0.0, [start_id]
         
-        # Initialize distances and predecessors
-        distances = {place_id: float('inf') for place_id in self.places_dict}
-        distances[start_id] = 0
-        predecessors = {place_id: None for place_id in self.places_dict}
+        start_idx = self.id_to_idx[start_id]
+        end_idx = self.id_to_idx[end_id]
+        distances, predecessors = self._single_source(start_idx)
         
-        # Priority queue: (distance, place_id)
-        pq = [(0, start_id)]
-        visited = set()
-        
-        while pq:
-            current_dist, current_id = heapq.heappop(pq)
-            
-            if current_id in visited:
-                continue
-            
-            visited.add(current_id)
-            
-            # Found destination
-            if current_id == end_id:
-                break
-            
-            # Check all neighbors
-            for edge in self.adjacency_list.get(current_id, []):
-                neighbor_id = edge.to_place_id
-                
-                if neighbor_id in visited:
-                    continue
-                
-                new_dist = current_dist + edge.distance_km
-                
-                if new_dist < distances[neighbor_id]:
-                    distances[neighbor_id] = new_dist
-                    predecessors[neighbor_id] = current_id
-                    heapq.heappush(pq, (new_dist, neighbor_id))
+        if not np.isfinite(distances[end_idx]):
+            logger.warning(f"No path found from {start_id} to {end_id}")
+            return float('inf'), []
         
         # Reconstruct path
         path = []
-        current = end_id
+        current = end_idx
         
-        while current is not None:
-            path.append(current)
+        while current != -1:
+            path.append(self.place_ids[current])
             current = predecessors[current]
         
         path.reverse()
         
-        # Check if path exists
-        if path[0] != start_id:
-            logger.warning(f"No path found from {start_id} to {end_id}")
-            return float('inf'), []
-        
-        return distances[end_id], path
+        return float(distances[end_idx]), path
     
     def get_shortest_distance(self, start_id: str, end_id: str) -> float:
         """
@@ -174,8 +136,81 @@ class PlaceGraph:
         Returns:
             Shortest distance in kilometers
         """
-        distance, _ = self.dijkstra(start_id, end_id)
-        return distance
+        start_idx = self.id_to_idx.get(start_id)
+        end_idx = self.id_to_idx.get(end_id)
+        
+        if start_idx is None or end_idx is None:
+            logger.warning(f"Place not found: {start_id} or {end_id}")
+            return float('inf')
+        
+        if start_idx == end_idx:
+            return 0.0
+        
+        distances, _ = self._single_source(start_idx)
+        return float(distances[end_idx])
+    
+    def distance_by_idx(self, start_idx: int, end_idx: int) -> float:
+        """
+        Get shortest distance between two places by graph index
+        
+        Args:
+            start_idx: Starting place index (into place_ids)
+            end_idx: Destination place index
+            
+        Returns:
+            Shortest distance in kilometers
+        """
+        if start_idx == end_idx:
+            return 0.0
+        
+        distances, _ = self._single_source(start_idx)
+        return float(distances[end_idx])
+    
+    def distance_submatrix(self, indices: np.ndarray) -> np.ndarray:
+        """
+        Get shortest distances among a subset of places by graph index
+        
+        Args:
+            indices: Place indices (into place_ids), -1 for unknown places
+            
+        Returns:
+            (m, m) distances in kilometers (inf to/from unknown places, 0 on the diagonal)
+        """
+        m = len(indices)
+        result = np.full((m, m), np.inf)
+        known = np.flatnonzero(indices >= 0)
+        
+        for r in known:
+            distances, _ = self._single_source(int(indices[r]))
+            result[r, known] = distances[indices[known]]
+        
+        np.fill_diagonal(result, 0.0)
+        return result
+    
+    def distances_from(self, source_id: str, target_ids: List[str]) -> np.ndarray:
+        """
+        Get shortest distances from one place to many (single SSSP run)
+        
+        Args:
+            source_id: Starting place ID
+            target_ids: Destination place IDs
+            
+        Returns:
+            Distances in kilometers aligned with target_ids (inf if unknown)
+        """
+        result = np.full(len(target_ids), np.inf)
+        
+        start_idx = self.id_to_idx.get(source_id)
+        if start_idx is None:
+            logger.warning(f"Place not found: {source_id}")
+            return result
+        
+        target_idx = np.array([self.id_to_idx.get(pid, -1) for pid in target_ids], dtype=np.int64)
+        known = target_idx >= 0
+        
+        distances, _ = self._single_source(start_idx)
+        result[known] = distances[target_idx[known]]
+        return result
     
     def get_shortest_path(self, start_id: str, end_id: str) -> List[Place]:
         """
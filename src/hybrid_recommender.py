@@ -7,6 +7,7 @@ Uses:
 - SVD Matrix Factorization for collaborative filtering (50-dim embeddings)
 """
 
+import heapq
 import logging
 from typing import List, Dict, Tuple, Optional
 
@@ -70,7 +71,8 @@ class HybridRecommender:
         candidate_places: List[Place],
         selected_places: List[Place],
         alpha: float = None,
-        total_available_places: int = 30
+        total_available_places: int = 30,
+        candidate_embeddings=None
     ) -> Dict[str, float]:
         """
         Calculate hybrid scores combining content-based and collaborative filtering
@@ -85,6 +87,7 @@ class HybridRecommender:
             alpha: Weight for content-based filtering (0-1). If None, calculated from user_pref
             total_available_places: Total places available in city (for alpha calculation)
                                    Should be len(candidate_places) clipped to [30, 200]
+            candidate_embeddings: Optional cached BERT matrix aligned with candidate_places
             
         Returns:
             Dictionary mapping place_id to hybrid score
@@ -97,23 +100,23 @@ class HybridRecommender:
         
         # Calculate content-based scores
         content_scores = self.content_filter.calculate_content_scores(
-            user_pref, candidate_places, selected_places
+            user_pref, candidate_places, selected_places,
+            candidate_embeddings=candidate_embeddings
         )
         
-        # Calculate collaborative scores
-        collaborative_scores = self.collaborative_filter.calculate_collaborative_scores(
+        # Calculate collaborative scores (array aligned with candidate_places)
+        collaborative_scores = self.collaborative_filter.calculate_collaborative_score_array(
             user_pref.user_id, candidate_places
         )
         
         # Combine scores
         hybrid_scores = {}
         
-        for place in candidate_places:
+        for place, collab_score in zip(candidate_places, collaborative_scores.tolist()):
             place_id = place.place_id
             
             # Get individual scores (default to 0.5 if not available)
             content_score = content_scores.get(place_id, 0.5)
-            collab_score = collaborative_scores.get(place_id, 0.5)
             
             # Calculate hybrid score
             hybrid_score = alpha * content_score + (1 - alpha) * collab_score
@@ -135,7 +138,8 @@ class HybridRecommender:
         candidate_places: List[Place],
         selected_places: List[Place],
         k: int = None,
-        alpha: float = None
+        alpha: float = None,
+        candidate_embeddings=None
     ) -> List[Tuple[Place, float]]:
         """
         Get top K recommended places, balanced across categories
@@ -146,6 +150,7 @@ class HybridRecommender:
             selected_places: Places user has selected
             k: Number of recommendations. If None, uses config.TOP_K_PLACES
             alpha: Weight for content-based filtering
+            candidate_embeddings: Optional cached BERT matrix aligned with candidate_places
             
         Returns:
             List of (Place, score) tuples sorted by score
@@ -162,7 +167,8 @@ class HybridRecommender:
         # Calculate hybrid scores với alpha dựa trên clipped pool
         scores = self.calculate_hybrid_scores(
             user_pref, candidate_places, selected_places, alpha, 
-            total_available_places=total_available_clipped
+            total_available_places=total_available_clipped,
+            candidate_embeddings=candidate_embeddings
         )
         
         # Create place lookup
@@ -187,11 +193,6 @@ class HybridRecommender:
             elif PlaceFilter.is_activity(place):
                 activities.append((pid, score))
         
-        # Sort each category by score
-        restaurants.sort(key=lambda x: x[1], reverse=True)
-        hotels.sort(key=lambda x: x[1], reverse=True)
-        activities.sort(key=lambda x: x[1], reverse=True)
-        
         # Calculate balanced distribution
         # For a 3-day trip: need ~6 activities, ~6 restaurants, ~3 hotels per day
         num_days = user_pref.trip_duration_days
@@ -201,10 +202,10 @@ class HybridRecommender:
         k_restaurants = min(len(restaurants), int(k * 0.3))
         k_hotels = min(len(hotels), k - k_activities - k_restaurants)  # Remaining
         
-        # Take top from each category
-        top_activities = activities[:k_activities]
-        top_restaurants = restaurants[:k_restaurants]
-        top_hotels = hotels[:k_hotels]
+        # Take top from each category (bounded heap, O(N log k) instead of full sort)
+        top_activities = heapq.nlargest(k_activities, activities, key=lambda x: x[1])
+        top_restaurants = heapq.nlargest(k_restaurants, restaurants, key=lambda x: x[1])
+        top_hotels = heapq.nlargest(k_hotels, hotels, key=lambda x: x[1])
         
         # Combine and sort by score
         balanced_recommendations = top_activities + top_restaurants + top_hotels
@@ -163,15 +163,16 @@ class ItineraryBuilder:
     Build complete itineraries from user preferences
     """
     
-    def __init__(self, all_places: List[Place]):
+    def __init__(self, all_places: List[Place], distance_matrix=None):
         """
         Initialize itinerary builder
         
         Args:
             all_places: All available places in destination
+            distance_matrix: Optional precomputed Haversine matrix aligned with all_places
         """
         self.all_places = all_places
-        self.graph = PlaceGraph(all_places)
+        self.graph = PlaceGraph(all_places, distance_matrix=distance_matrix)
         self.scheduler = BlockScheduler(self.graph, all_places)
         
         logger.info(f"ItineraryBuilder initialized with {len(all_places)} places")
@@ -368,9 +369,9 @@ class ItineraryBuilder:
                 transport_info = TransportManager.get_transport_info(distance)
                 
                 # Update current place with transport to next
-                current.transport_to_next = transport_info['mode']
-                current.distance_to_next_km = transport_info['distance_km']
-                current.travel_time_to_next_hours = transport_info['travel_time_hours']
-                current.travel_cost_to_next = transport_info['cost_usd']
+                current.transport_to_next = transport_info.mode
+                current.distance_to_next_km = transport_info.distance_km
+                current.travel_time_to_next_hours = transport_info.travel_time_hours
+                current.travel_cost_to_next = transport_info.cost_usd
         
         return tour
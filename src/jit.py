@@ -0,0 +1,26 @@
+"""
+Numba JIT helpers
+Falls back to plain Python functions when numba is not installed
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    logger.info("numba not installed, numeric kernels run as plain Python")
+    NUMBA_AVAILABLE = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (supports @njit and @njit(...))"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        
+        def decorator(func):
+            return func
+        
+        return decorator
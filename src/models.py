@@ -6,9 +6,29 @@ Defines the structure of places, tours, and user preferences
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
+import logging
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+
+# MongoDB projection with only the fields read by Place.from_dict
+PLACE_PROJECTION = {
+    "_id": 0,
+    "id": 1,
+    "displayName": 1,
+    "name": 1,
+    "city": 1,
+    "types": 1,
+    "rating": 1,
+    "location": 1,
+    "priceLevel": 1,
+    "avg_price": 1,
+    "userRatingCount": 1,
+    "regularOpeningHours": 1
+}
+
+
+@dataclass(slots=True)
 class Place:
     """Place/Location model"""
     place_id: str
@@ -69,6 +89,28 @@ class Place:
             opening_hours=data.get("regularOpeningHours", {})
         )
     
+    @classmethod
+    def from_dicts(cls, docs: List[Dict[str, Any]]) -> List['Place']:
+        """
+        Create Places from a batch of MongoDB documents
+        
+        Documents are parsed in one pass, each on its own, so malformed ones
+        are skipped without re-parsing the rest of the batch.
+        """
+        places = []
+        first_error = None
+        for doc in docs:
+            try:
+                places.append(cls.from_dict(doc))
+            except Exception as e:
+                first_error = first_error or f"{doc.get('id', 'unknown')}: {e}"
+        
+        # One summary line per batch instead of one per bad document
+        bad = len(docs) - len(places)
+        if bad:
+            logger.warning("Parse failures: %d/%d (first: %s)", bad, len(docs), first_error)
+        return places
+    
     def get_category(self) -> str:
         """Determine the main category of this place"""
         from .config import config
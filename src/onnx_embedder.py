@@ -0,0 +1,202 @@
+"""
+ONNX Runtime BERT Embedder
+Int8 dynamically-quantized export of the sentence-transformers model for fast CPU inference
+"""
+
+import numpy as np
+from typing import List, Union
+from pathlib import Path
+from functools import lru_cache
+import logging
+import os
+import shutil
+import tempfile
+
+from .config import config
+
+logger = logging.getLogger(__name__)
+
+
+class OnnxEmbedder:
+    """
+    Drop-in replacement for SentenceTransformer.encode backed by ONNX Runtime
+    
+    Features:
+    - One-time export to ONNX + dynamic int8 quantization (cached on disk)
+    - Mean pooling over tokens (same as the sentence-transformers pipeline)
+    - Single-threaded session by default so API workers don't oversubscribe cores
+    """
+    
+    QUANTIZED_FILE = "model_quantized.onnx"
+    
+    def __init__(
+        self,
+        model_name: str = "sentence-transformers/paraphrase-multilingual-mpnet-base-v2",
+        export_dir: str = "data/models/onnx",
+        num_threads: int = 1,
+        max_seq_length: int = 128
+    ):
+        """
+        Load (exporting and quantizing on first use) the ONNX model
+        
+        Args:
+            model_name: HuggingFace model id
+            export_dir: Directory to store the exported/quantized model
+            num_threads: ONNX Runtime intra-op threads
+            max_seq_length: Max tokens per text
+        """
+        import onnxruntime
+        from transformers import AutoTokenizer
+        from optimum.onnxruntime import ORTModelForFeatureExtraction
+        
+        self.max_seq_length = max_seq_length
+        quantized_dir = Path(export_dir) / "quantized"
+        
+        if not (quantized_dir / self.QUANTIZED_FILE).exists():
+            self._export_quantized(model_name, Path(export_dir))
+        
+        session_options = onnxruntime.SessionOptions()
+        session_options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        session_options.intra_op_num_threads = num_threads
+        session_options.inter_op_num_threads = 1
+        
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+        self.model = ORTModelForFeatureExtraction.from_pretrained(
+            quantized_dir,
+            file_name=self.QUANTIZED_FILE,
+            provider="CPUExecutionProvider",
+            session_options=session_options
+        )
+        
+        logger.info(f"ONNX int8 embedder loaded from {quantized_dir} ({num_threads} thread(s))")
+    
+    @staticmethod
+    def _export_quantized(model_name: str, export_dir: Path, replace: bool = False):
+        """
+        Export model to ONNX and apply dynamic int8 weight quantization
+        
+        The export is built in a temp directory next to export_dir and renamed
+        into place, so workers exporting at the same time never read or write
+        a partial model; if another worker's export lands first it is kept.
+        """
+        from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+        
+        quantized_file = export_dir / "quantized" / OnnxEmbedder.QUANTIZED_FILE
+        export_dir.parent.mkdir(parents=True, exist_ok=True)
+        tmp_dir = Path(tempfile.mkdtemp(prefix=f".{export_dir.name}-", dir=export_dir.parent))
+        try:
+            logger.info(f"Exporting {model_name} to ONNX (one-time)...")
+            model = ORTModelForFeatureExtraction.from_pretrained(model_name, export=True)
+            model.save_pretrained(tmp_dir)
+            
+            quantizer = ORTQuantizer.from_pretrained(model)
+            qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+            quantizer.quantize(save_dir=tmp_dir / "quantized", quantization_config=qconfig)
+            
+            # A directory rename can't overwrite a non-empty directory: clear
+            # a forced or incomplete export first
+            if export_dir.exists() and (replace or not quantized_file.exists()):
+                shutil.rmtree(export_dir)
+            try:
+                os.replace(tmp_dir, export_dir)
+            except OSError:
+                if not quantized_file.exists():
+                    raise
+                logger.info(f"Quantized ONNX model already exported to {quantized_file.parent}")
+            else:
+                logger.info(f"Quantized ONNX model saved to {quantized_file.parent}")
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+    
+    def encode(
+        self,
+        sentences: Union[str, List[str]],
+        batch_size: int = 32,
+        show_progress_bar: bool = False,
+        convert_to_numpy: bool = True,
+        normalize_embeddings: bool = False
+    ) -> np.ndarray:
+        """
+        Encode texts into sentence embeddings
+        
+        Args:
+            sentences: Single text or list of texts
+            batch_size: Texts per forward pass
+            show_progress_bar: Unused (kept for SentenceTransformer compatibility)
+            convert_to_numpy: Unused, always returns numpy
+            normalize_embeddings: L2-normalize output vectors
+        
+        Returns:
+            float32 array (dim,) for a single text, (n, dim) for a list
+        """
+        single = isinstance(sentences, str)
+        texts = [sentences] if single else list(sentences)
+        
+        # Encode longest texts first so each batch pads to a similar length
+        # (as sentence-transformers does), then restore the input order
+        order = sorted(range(len(texts)), key=lambda i: -len(texts[i]))
+        sorted_texts = [texts[i] for i in order]
+        
+        batches = []
+        for start in range(0, len(sorted_texts), batch_size):
+            inputs = self.tokenizer(
+                sorted_texts[start:start + batch_size],
+                padding=True,
+                truncation=True,
+                max_length=self.max_seq_length,
+                return_tensors="np"
+            )
+            token_embeddings = self.model(**inputs).last_hidden_state
+            
+            # Mean pooling over non-padding tokens
+            mask = inputs["attention_mask"][..., None].astype(np.float32)
+            summed = (token_embeddings * mask).sum(axis=1)
+            counts = np.clip(mask.sum(axis=1), 1e-9, None)
+            batches.append(summed / counts)
+        
+        embeddings = np.vstack(batches).astype(np.float32) if batches else np.zeros((0, 768), dtype=np.float32)
+        embeddings[order] = embeddings.copy()
+        
+        if normalize_embeddings and len(embeddings):
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings = embeddings / np.clip(norms, 1e-12, None)
+        
+        return embeddings[0] if single else embeddings
+
+
+def export_onnx_model(
+    model_name: str = "sentence-transformers/paraphrase-multilingual-mpnet-base-v2",
+    export_dir: str = config.BERT_ONNX_DIR,
+    force: bool = False
+) -> Path:
+    """
+    Export and quantize the model ahead of time (e.g. at image build)
+    
+    Returns:
+        Directory of the quantized model
+    """
+    quantized_dir = Path(export_dir) / "quantized"
+    if force or not (quantized_dir / OnnxEmbedder.QUANTIZED_FILE).exists():
+        OnnxEmbedder._export_quantized(model_name, Path(export_dir), replace=force)
+    else:
+        logger.info(f"Quantized ONNX model already exported to {quantized_dir}")
+    return quantized_dir
+
+
+@lru_cache(maxsize=1)
+def get_onnx_embedder() -> OnnxEmbedder:
+    """Get the process-wide ONNX embedder (loaded once per worker)"""
+    return OnnxEmbedder(
+        export_dir=config.BERT_ONNX_DIR,
+        num_threads=config.BERT_ONNX_THREADS,
+        max_seq_length=config.BERT_MAX_SEQ_LENGTH
+    )
+
+
+if __name__ == "__main__":
+    # python -m src.onnx_embedder [--force]
+    import sys
+    
+    logging.basicConfig(level=logging.INFO)
+    export_onnx_model(force="--force" in sys.argv[1:])
@@ -4,7 +4,7 @@ Filter places based on type, opening hours, and time blocks
 """
 
 import logging
-from typing import List, Dict, Optional, Set, Any
+from typing import List, Dict, Optional, Set, Any, Iterable
 from datetime import time, datetime, timedelta
 
 from src.models import Place
@@ -175,25 +175,30 @@ class PlaceFilter:
     @staticmethod
     def filter_by_types(
         places: List[Place],
-        allowed_types: List[str]
+        allowed_types: Iterable[str]
     ) -> List[Place]:
         """
         Filter places by allowed types
         
         Args:
             places: List of places
-            allowed_types: List of allowed place types
+            allowed_types: Allowed place types (any case)
             
         Returns:
             Filtered list of places
         """
-        allowed_set = set(t.lower() for t in allowed_types)
+        # The prebuilt block sets are lowercase already; any other collection,
+        # frozensets included, is lowercased here
+        if any(allowed_types is block_types for block_types in TimeBlockConfig.BLOCK_PLACE_TYPES.values()):
+            allowed_set = allowed_types
+        else:
+            allowed_set = {t.lower() for t in allowed_types}
         
-        filtered = []
-        for place in places:
-            place_types = set(t.lower() for t in place.types)
-            if place_types & allowed_set:  # Intersection
-                filtered.append(place)
+        # isdisjoint stops at the first shared type, no per-place set is built
+        filtered = [
+            place for place in places
+            if not allowed_set.isdisjoint(t.lower() for t in place.types)
+        ]
         
         logger.debug(f"Filtered {len(places)} places → {len(filtered)} by types")
         return filtered
@@ -0,0 +1,98 @@
+"""
+Routing Kernels
+Numba-compiled haversine distance matrix and dense Dijkstra
+"""
+
+import math
+import numpy as np
+
+from src.jit import njit, NUMBA_AVAILABLE
+
+EARTH_RADIUS_KM = 6371.0
+
+
+@njit(cache=True, fastmath=True)
+def haversine_matrix(lat: np.ndarray, lng: np.ndarray) -> np.ndarray:
+    """
+    All-pairs Haversine distances
+    
+    Args:
+        lat: Latitudes in degrees, shape (n,)
+        lng: Longitudes in degrees, shape (n,)
+        
+    Returns:
+        Symmetric (n, n) distance matrix in kilometers
+    """
+    n = lat.shape[0]
+    out = np.zeros((n, n), dtype=np.float64)
+    
+    for i in range(n):
+        lat1 = math.radians(lat[i])
+        lon1 = math.radians(lng[i])
+        cos_lat1 = math.cos(lat1)
+        
+        for j in range(i + 1, n):
+            lat2 = math.radians(lat[j])
+            lon2 = math.radians(lng[j])
+            
+            dlat = lat2 - lat1
+            dlon = lon2 - lon1
+            a = math.sin(dlat / 2) ** 2 + cos_lat1 * math.cos(lat2) * math.sin(dlon / 2) ** 2
+            d = 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+            
+            out[i, j] = d
+            out[j, i] = d
+    
+    return out
+
+
+@njit(cache=True)
+def dijkstra_dense(dist: np.ndarray, src: int):
+    """
+    Single-source Dijkstra on a dense (complete) graph
+    
+    Uses an O(n²) array scan instead of a heap, which is optimal when every
+    pair of nodes is connected.
+    
+    Args:
+        dist: (n, n) edge weights
+        src: Source node index
+        
+    Returns:
+        Tuple of (distances (n,), predecessors (n,) with -1 for none)
+    """
+    n = dist.shape[0]
+    best = np.full(n, np.inf)
+    pred = np.full(n, -1, dtype=np.int64)
+    visited = np.zeros(n, dtype=np.bool_)
+    best[src] = 0.0
+    
+    for _ in range(n):
+        # Pick closest unvisited node
+        u = -1
+        du = np.inf
+        for v in range(n):
+            if not visited[v] and best[v] < du:
+                du = best[v]
+                u = v
+        
+        if u == -1:
+            break
+        
+        visited[u] = True
+        
+        # Relax all edges out of u
+        for v in range(n):
+            if not visited[v]:
+                nd = du + dist[u, v]
+                if nd < best[v]:
+                    best[v] = nd
+                    pred[v] = u
+    
+    return best, pred
+
+
+# Warm-up: load compiled kernels (or compile once) at import time
+if NUMBA_AVAILABLE:
+    _warm = haversine_matrix(np.zeros(2), np.zeros(2))
+    dijkstra_dense(_warm, 0)
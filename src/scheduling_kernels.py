@@ -0,0 +1,292 @@
+"""
+Scheduling Kernels
+Numba-compiled evaluation of activity sequences over precomputed travel matrices
+"""
+
+import numpy as np
+
+from src.jit import njit, prange, NUMBA_AVAILABLE
+
+
+@njit(cache=True)
+def eval_sequence(
+    perm: np.ndarray,
+    travel_time: np.ndarray,
+    cost: np.ndarray,
+    scores: np.ndarray,
+    start_h: float,
+    end_h: float,
+    visit_duration: float,
+    prev_idx: int,
+    available_hours: float
+):
+    """
+    Evaluate a visiting order within a time block
+    
+    Args:
+        perm: Candidate indices in visiting order
+        travel_time: (m, m) travel hours between candidates
+        cost: (m, m) travel cost between candidates
+        scores: (n,) candidate scores
+        start_h: Block start (hours since midnight)
+        end_h: Block end (hours since midnight, past 24 if overnight)
+        visit_duration: Hours spent at each place
+        prev_idx: Matrix index of the previous location (-1 if none)
+        available_hours: Block hours minus buffer
+        
+    Returns:
+        Tuple of (total_score, total_travel_hours, total_cost, fits)
+    """
+    n = perm.shape[0]
+    current = start_h
+    total_travel = 0.0
+    total_cost = 0.0
+    total_score = 0.0
+    prev = prev_idx
+    
+    for i in range(n):
+        idx = perm[i]
+        if prev >= 0:
+            current += travel_time[prev, idx]
+            total_travel += travel_time[prev, idx]
+            total_cost += cost[prev, idx]
+        
+        current += visit_duration
+        if current > end_h:
+            return 0.0, 0.0, 0.0, False
+        
+        total_score += scores[idx]
+        prev = idx
+    
+    if total_travel + visit_duration * n > available_hours:
+        return 0.0, 0.0, 0.0, False
+    
+    return total_score, total_travel, total_cost, True
+
+
+@njit(cache=True)
+def path_travel(order: np.ndarray, travel_time: np.ndarray, prev_idx: int) -> float:
+    """Total travel hours along order, starting from prev_idx (when >= 0)"""
+    total = travel_time[prev_idx, order[0]] if prev_idx >= 0 else 0.0
+    for i in range(1, order.shape[0]):
+        total += travel_time[order[i - 1], order[i]]
+    return total
+
+
+@njit(cache=True)
+def min_travel_perm(combo: np.ndarray, travel_time: np.ndarray, prev_idx: int) -> np.ndarray:
+    """
+    Order a combination by minimum total travel time, trying every ordering
+    
+    Enumerates orderings in place with iterative Heap's algorithm, so no
+    permutation tuples are created.
+    
+    Args:
+        combo: Candidate indices to order
+        travel_time: (m, m) travel hours between candidates
+        prev_idx: Matrix index of the previous location (-1 if none)
+        
+    Returns:
+        Candidate indices in visiting order
+    """
+    k = combo.shape[0]
+    buf = combo.copy()
+    best_perm = combo.copy()
+    best_travel = path_travel(buf, travel_time, prev_idx)
+    
+    c = np.zeros(k, dtype=np.int64)
+    i = 0
+    while i < k:
+        if c[i] < i:
+            j = 0 if i % 2 == 0 else c[i]
+            tmp = buf[j]
+            buf[j] = buf[i]
+            buf[i] = tmp
+            
+            travel = path_travel(buf, travel_time, prev_idx)
+            if travel < best_travel:
+                best_travel = travel
+                best_perm[:] = buf
+            
+            c[i] += 1
+            i = 0
+        else:
+            c[i] = 0
+            i += 1
+    
+    return best_perm
+
+
+@njit(cache=True)
+def held_karp_order(combo: np.ndarray, travel_time: np.ndarray, prev_idx: int) -> np.ndarray:
+    """
+    Order a combination by minimum total travel time (Held-Karp bitmask DP)
+    
+    dp[mask, last] is the least travel needed to visit the places in mask,
+    starting from prev_idx (when >= 0) and ending at last. O(2^k · k²).
+    
+    Args:
+        combo: Candidate indices to order
+        travel_time: (m, m) travel hours between candidates
+        prev_idx: Matrix index of the previous location (-1 if none)
+        
+    Returns:
+        Candidate indices in visiting order
+    """
+    k = combo.shape[0]
+    full = (1 << k) - 1
+    dp = np.full((1 << k, k), np.inf)
+    parent = np.full((1 << k, k), -1, dtype=np.int64)
+    
+    for j in range(k):
+        dp[1 << j, j] = travel_time[prev_idx, combo[j]] if prev_idx >= 0 else 0.0
+    
+    # Masks only grow, so increasing numeric order visits subsets first
+    for mask in range(1, full + 1):
+        for last in range(k):
+            if not (mask >> last) & 1:
+                continue
+            base = dp[mask, last]
+            if base == np.inf:
+                continue
+            for nxt in range(k):
+                if (mask >> nxt) & 1:
+                    continue
+                nmask = mask | (1 << nxt)
+                cand = base + travel_time[combo[last], combo[nxt]]
+                if cand < dp[nmask, nxt]:
+                    dp[nmask, nxt] = cand
+                    parent[nmask, nxt] = last
+    
+    last = 0
+    for j in range(1, k):
+        if dp[full, j] < dp[full, last]:
+            last = j
+    
+    # Walk parents back from the cheapest end
+    order = np.empty(k, dtype=np.int64)
+    mask = full
+    for pos in range(k - 1, -1, -1):
+        order[pos] = combo[last]
+        prev_last = parent[mask, last]
+        mask ^= 1 << last
+        last = prev_last
+    
+    return order
+
+
+@njit(cache=True)
+def mst_weight(combo: np.ndarray, travel_time: np.ndarray, prev_idx: int) -> float:
+    """
+    Minimum spanning tree weight over a combination (plus prev_idx when >= 0)
+    
+    Any path through all those nodes is a spanning tree, so this is a lower
+    bound on the travel of every ordering. Prim's algorithm, O(k²).
+    
+    Args:
+        combo: Candidate indices
+        travel_time: (m, m) travel hours between candidates
+        prev_idx: Matrix index of the previous location (-1 if none)
+        
+    Returns:
+        Total MST travel hours
+    """
+    k = combo.shape[0]
+    n = k + 1 if prev_idx >= 0 else k
+    nodes = np.empty(n, dtype=np.int64)
+    nodes[:k] = combo
+    if prev_idx >= 0:
+        nodes[k] = prev_idx
+    
+    in_tree = np.zeros(n, dtype=np.bool_)
+    best = np.full(n, np.inf)
+    best[0] = 0.0
+    total = 0.0
+    
+    for _ in range(n):
+        u = -1
+        du = np.inf
+        for v in range(n):
+            if not in_tree[v] and best[v] < du:
+                du = best[v]
+                u = v
+        
+        if u == -1:
+            return np.inf
+        
+        in_tree[u] = True
+        total += du
+        for v in range(n):
+            if not in_tree[v]:
+                w = travel_time[nodes[u], nodes[v]]
+                if w < best[v]:
+                    best[v] = w
+    
+    return total
+
+
+@njit(parallel=True, cache=True)
+def search_combos_parallel(
+    combos: np.ndarray,
+    travel_time: np.ndarray,
+    cost: np.ndarray,
+    scores: np.ndarray,
+    start_h: float,
+    end_h: float,
+    visit_duration: float,
+    prev_idx: int,
+    available_hours: float,
+    exhaustive_max: int
+):
+    """
+    Order a batch of combinations in parallel, one combination per thread
+    
+    A sequence's score is the sum of its places' scores whatever the
+    order, so each combination is ordered by minimum travel alone (which
+    also makes it most likely to fit) and evaluated once: exhaustively up
+    to exhaustive_max places, by Held-Karp beyond (time blocks hold only a
+    handful of places). Combinations whose MST travel bound
+    already exceeds the block are skipped without being ordered.
+    
+    Args:
+        combos: (b, k) candidate indices, one combination per row
+        exhaustive_max: Largest k ordered by enumerating orderings
+        (remaining args as in eval_sequence)
+        
+    Returns:
+        Tuple of (found (b,) bool, perms (b, k) visiting orders)
+    """
+    b, k = combos.shape
+    found = np.zeros(b, dtype=np.bool_)
+    perms = combos.copy()
+    travel_budget = available_hours - visit_duration * k
+    
+    for r in prange(b):
+        # Reject without ordering when even the MST bound can't fit
+        if mst_weight(combos[r], travel_time, prev_idx) > travel_budget:
+            continue
+        
+        if k <= exhaustive_max:
+            perm = min_travel_perm(combos[r], travel_time, prev_idx)
+        else:
+            perm = held_karp_order(combos[r], travel_time, prev_idx)
+        
+        _, _, _, fits = eval_sequence(
+            perm, travel_time, cost, scores, start_h, end_h,
+            visit_duration, prev_idx, available_hours
+        )
+        
+        found[r] = fits
+        perms[r, :] = perm
+    
+    return found, perms
+
+
+# Warm-up: load compiled kernels (or compile once) at import time
+if NUMBA_AVAILABLE:
+    _warm = np.zeros((2, 2))
+    eval_sequence(np.zeros(2, dtype=np.int64), _warm, _warm, np.zeros(2), 8.0, 11.0, 1.0, -1, 3.0)
+    min_travel_perm(np.arange(2, dtype=np.int64), _warm, -1)
+    held_karp_order(np.arange(2, dtype=np.int64), _warm, -1)
+    mst_weight(np.arange(2, dtype=np.int64), _warm, -1)
+    search_combos_parallel(np.zeros((1, 2), dtype=np.int64), _warm, _warm, np.zeros(2), 8.0, 11.0, 1.0, -1, 3.0, 3)
@@ -0,0 +1,129 @@
+"""
+Scoring Kernels
+Numba-compiled collaborative scoring over SVD embeddings
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from src.jit import njit, prange, NUMBA_AVAILABLE
+
+
+def _readonly(array: np.ndarray) -> np.ndarray:
+    """
+    Read-only view of a warm-up array
+    
+    A loaded model's arrays are read-only memmaps, which numba types
+    differently from writable arrays; warming up with writable inputs
+    would leave the production signature to compile on the first request.
+    """
+    view = array.view()
+    view.setflags(write=False)
+    return view
+
+
+@lru_cache(maxsize=None)
+def make_score_rows(k: int):
+    """
+    Build score_rows specialized for k factors
+    
+    k is captured as a compile-time constant, so numba fully unrolls and
+    vectorizes the inner dot. Closures can't use numba's on-disk cache, so
+    the kernel is compiled (and warmed up here) once per k per process.
+    
+    Args:
+        k: Number of latent factors (embedding width)
+    
+    Returns:
+        score_rows(user_vec, place_codes, place_scales, idx, offset, default, out)
+    """
+    @njit(parallel=True, fastmath=True)
+    def score_rows(
+        user_vec: np.ndarray,
+        place_codes: np.ndarray,
+        place_scales: np.ndarray,
+        idx: np.ndarray,
+        offset: float,
+        default: float,
+        out: np.ndarray
+    ):
+        """
+        Fused gather + dot + dequantize + clip of predicted ratings, normalized to [0, 1]
+        
+        Args:
+            user_vec: (k,) user embedding
+            place_codes: (n_places, k) int8 quantized place embeddings
+            place_scales: (n_places,) per-row dequantization scales
+            idx: (n,) place rows to score, -1 for places not in training
+            offset: Added to every prediction (global mean of centered ratings)
+            default: Score for places not in training
+            out: (n,) output scores
+        """
+        for i in prange(idx.shape[0]):
+            row = idx[i]
+            if row < 0:
+                out[i] = default
+                continue
+            
+            s = 0.0
+            for j in range(k):
+                s += user_vec[j] * place_codes[row, j]
+            s = offset + s * place_scales[row]
+            
+            out[i] = min(5.0, max(0.0, s)) / 5.0
+    
+    if NUMBA_AVAILABLE:
+        # Model arrays are read-only memmaps after load_model and candidate
+        # row arrays come read-only from the model's cache
+        score_rows(
+            _readonly(np.zeros(k, dtype=np.float32)),
+            _readonly(np.zeros((1, k), dtype=np.int8)),
+            _readonly(np.ones(1, dtype=np.float32)),
+            _readonly(np.array([0, -1], dtype=np.int64)),
+            3.0,
+            0.6,
+            np.empty(2)
+        )
+    
+    return score_rows
+
+
+@njit(fastmath=True, cache=True)
+def predict_one(
+    user_embeddings: np.ndarray,
+    place_codes: np.ndarray,
+    place_scales: np.ndarray,
+    u_idx: int,
+    p_idx: int,
+    offset: float
+) -> float:
+    """
+    Predicted rating of a single (user row, place row) pair clipped to [0, 5]
+    
+    Args:
+        user_embeddings: (n_users, k) user embeddings
+        place_codes: (n_places, k) int8 quantized place embeddings
+        place_scales: (n_places,) per-row dequantization scales
+        u_idx: User row
+        p_idx: Place row
+        offset: Added to the prediction (global mean of centered ratings)
+    """
+    s = 0.0
+    for j in range(user_embeddings.shape[1]):
+        s += user_embeddings[u_idx, j] * place_codes[p_idx, j]
+    s = offset + s * place_scales[p_idx]
+    
+    return min(5.0, max(0.0, s))
+
+
+# Warm-up: load compiled kernels (or compile once) at import time
+if NUMBA_AVAILABLE:
+    predict_one(
+        _readonly(np.zeros((1, 2), dtype=np.float32)),
+        _readonly(np.zeros((1, 2), dtype=np.int8)),
+        _readonly(np.ones(1, dtype=np.float32)),
+        0,
+        0,
+        3.0
+    )
@@ -8,7 +8,7 @@ import logging
 from typing import List, Dict, Optional
 from datetime import date
 
-from src.models import Place, UserPreference
+from src.models import Place, UserPreference, PLACE_PROJECTION
 from src.database import MongoDBHandler
 from src.graph_builder import PlaceGraph
 from src.itinerary_builder import ItineraryBuilder, TourItinerary
@@ -33,7 +33,8 @@ class SmartItineraryPlanner:
     def __init__(
         self,
         db_handler: Optional[MongoDBHandler] = None,
-        use_hybrid_scoring: bool = True
+        use_hybrid_scoring: bool = True,
+        recommender: Optional[HybridRecommender] = None
     ):
         """
         Initialize Smart Itinerary Planner
@@ -41,12 +42,13 @@ class SmartItineraryPlanner:
         Args:
             db_handler: MongoDB handler (creates new if None)
             use_hybrid_scoring: Whether to use BERT+SVD hybrid scoring
+            recommender: Shared HybridRecommender (creates new if None)
         """
         self.db = db_handler or MongoDBHandler()
         self.use_hybrid_scoring = use_hybrid_scoring
         
         if use_hybrid_scoring:
-            self.recommender = HybridRecommender()
+            self.recommender = recommender or HybridRecommender()
             logger.info("Initialized with BERT+SVD hybrid scoring")
         else:
             self.recommender = None
@@ -56,7 +58,9 @@ class SmartItineraryPlanner:
         self,
         user_pref: UserPreference,
         start_date: Optional[date] = None,
-        max_places: int = 200
+        max_places: int = 200,
+        places: Optional[List[Place]] = None,
+        distance_matrix=None
     ) -> TourItinerary:
         """
         Generate complete itinerary for a trip
@@ -65,6 +69,8 @@ class SmartItineraryPlanner:
             user_pref: User preferences
             start_date: Tour start date (defaults to today)
             max_places: Maximum places to consider
+            places: Pre-loaded candidate places (skips the database load)
+            distance_matrix: Precomputed Haversine matrix aligned with places
             
         Returns:
             TourItinerary with complete schedule
@@ -74,8 +80,9 @@ class SmartItineraryPlanner:
             f"in {user_pref.destination_city}"
         )
         
-        # Step 1: Load places from database
-        places = self._load_places(user_pref.destination_city, max_places)
+        # Step 1: Load places from database (unless provided by caller)
+        if places is None:
+            places = self._load_places(user_pref.destination_city, max_places)
         
         if not places:
             raise ValueError(f"No places found in {user_pref.destination_city}")
@@ -88,7 +95,7 @@ class SmartItineraryPlanner:
             hybrid_scores = self._calculate_hybrid_scores(places, user_pref)
         
         # Step 3: Build itinerary
-        builder = ItineraryBuilder(places)
+        builder = ItineraryBuilder(places, distance_matrix=distance_matrix)
         tour = builder.build_itinerary(
             user_pref=user_pref,
             start_date=start_date,
@@ -111,17 +118,10 @@ class SmartItineraryPlanner:
         
         # Query places in destination city, sorted by rating
         query = {"city": destination_city}
-        cursor = places_collection.find(query).sort("rating", -1).limit(max_places)
-        
-        places = []
-        for doc in cursor:
-            try:
-                # Use from_dict to handle MongoDB schema correctly
-                place = Place.from_dict(doc)
-                places.append(place)
-            except Exception as e:
-                logger.warning(f"Failed to load place {doc.get('id', 'unknown')}: {e}")
-                continue
+        cursor = places_collection.find(query, projection=PLACE_PROJECTION).sort("rating", -1).limit(max_places)
+        
+        # Use from_dicts to handle MongoDB schema correctly
+        places = Place.from_dicts(list(cursor))
         
         logger.info(f"Loaded {len(places)} places from {destination_city}")
         return places
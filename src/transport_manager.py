@@ -4,10 +4,13 @@ Manages transport modes and selection logic
 """
 
 import logging
+from functools import lru_cache
 from typing import Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -39,6 +42,18 @@ class TransportConfig:
         return distance_km <= self.max_distance_km
 
 
+@dataclass(frozen=True, slots=True)
+class TransportInfo:
+    """Transport details for a journey (immutable, shared between cache hits)"""
+    mode: str
+    distance_km: float
+    travel_time_hours: float
+    travel_time_minutes: float
+    cost_usd: float
+    speed_kmh: float
+    reason: str
+
+
 class TransportManager:
     """
     Manages transport selection based on distance and time constraints
@@ -67,6 +82,13 @@ class TransportManager:
         ),
     }
     
+    # Priority order: walking → motorbike → taxi
+    PRIORITY_ORDER = (
+        TransportMode.WALKING,
+        TransportMode.MOTORBIKE,
+        TransportMode.TAXI
+    )
+    
     @classmethod
     def select_transport(
         cls,
@@ -83,14 +105,7 @@ class TransportManager:
         Returns:
             Tuple of (selected_transport_config, reason)
         """
-        # Priority order: walking → motorbike → taxi
-        priority_order = [
-            TransportMode.WALKING,
-            TransportMode.MOTORBIKE,
-            TransportMode.TAXI
-        ]
-        
-        for mode in priority_order:
+        for mode in cls.PRIORITY_ORDER:
             config = cls.TRANSPORT_CONFIGS[mode]
             
             # Check distance constraint
@@ -157,31 +172,56 @@ class TransportManager:
         cls,
         distance_km: float,
         available_time_hours: Optional[float] = None
-    ) -> dict:
+    ) -> TransportInfo:
         """
         Get complete transport information for a journey
         
+        Results are memoized on the distance quantized to 10 m, so repeated
+        lookups in scheduling loops share one (immutable) TransportInfo.
+        
         Args:
             distance_km: Distance in kilometers
             available_time_hours: Available time in hours
             
         Returns:
-            Dictionary with transport details
+            TransportInfo with transport details
         """
-        config, reason = cls.select_transport(distance_km, available_time_hours)
+        return _transport_info_cached(round(distance_km, 2), available_time_hours)
+    
+    @classmethod
+    def travel_times_batch(
+        cls,
+        distances_km: np.ndarray,
+        available_time_hours: Optional[float] = None
+    ) -> np.ndarray:
+        """
+        Travel times for many journeys at once
         
-        travel_time_hours = config.calculate_travel_time_hours(distance_km)
-        cost = config.calculate_cost(distance_km)
+        Applies the same selection rules as select_transport (including the
+        taxi fallback) and rounding as get_transport_info, vectorized.
         
-        return {
-            'mode': config.mode.value,
-            'distance_km': round(distance_km, 2),
-            'travel_time_hours': round(travel_time_hours, 2),
-            'travel_time_minutes': round(travel_time_hours * 60, 1),
-            'cost_usd': round(cost, 2),
-            'speed_kmh': config.avg_speed_kmh,
-            'reason': reason
-        }
+        Args:
+            distances_km: Distances in kilometers
+            available_time_hours: Available time in hours
+            
+        Returns:
+            Travel times in hours
+        """
+        distances = np.round(np.asarray(distances_km, dtype=np.float64), 2)
+        
+        taxi = cls.TRANSPORT_CONFIGS[TransportMode.TAXI]
+        times = distances / taxi.avg_speed_kmh
+        
+        # Lowest priority first so higher priorities overwrite
+        for mode in reversed(cls.PRIORITY_ORDER):
+            config = cls.TRANSPORT_CONFIGS[mode]
+            mode_times = distances / config.avg_speed_kmh
+            valid = distances <= config.max_distance_km
+            if available_time_hours is not None:
+                valid &= mode_times <= available_time_hours
+            times = np.where(valid, mode_times, times)
+        
+        return np.round(times, 2)
     
     @classmethod
     def get_all_configs(cls) -> dict:
@@ -194,3 +234,25 @@ class TransportManager:
             }
             for mode, config in cls.TRANSPORT_CONFIGS.items()
         }
+
+
+@lru_cache(maxsize=8192)
+def _transport_info_cached(
+    distance_km: float,
+    available_time_hours: Optional[float]
+) -> TransportInfo:
+    """Build (once per quantized distance) the transport info for a journey"""
+    config, reason = TransportManager.select_transport(distance_km, available_time_hours)
+    
+    travel_time_hours = config.calculate_travel_time_hours(distance_km)
+    cost = config.calculate_cost(distance_km)
+    
+    return TransportInfo(
+        mode=config.mode.value,
+        distance_km=round(distance_km, 2),
+        travel_time_hours=round(travel_time_hours, 2),
+        travel_time_minutes=round(travel_time_hours * 60, 1),
+        cost_usd=round(cost, 2),
+        speed_kmh=config.avg_speed_kmh,
+        reason=reason
+    )
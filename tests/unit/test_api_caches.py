@@ -0,0 +1,197 @@
+"""
+Unit tests for the in-process API caches
+ResponseCache TTL/LRU/invalidation and CityCache LRU/per-city loading
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+pytest.importorskip("fastapi")
+pytest.importorskip("pydantic_settings")
+
+from pydantic import BaseModel
+
+from api import response_cache
+from api.city_cache import CityCache
+from api.response_cache import ResponseCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeCursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def sort(self, *args):
+        return self
+
+    def limit(self, n):
+        self.docs = self.docs[:n]
+        return self
+
+    async def to_list(self, length):
+        await asyncio.sleep(0)  # let concurrent requests interleave
+        return self.docs[:length]
+
+
+class FakePlaces:
+    def __init__(self, docs_by_city):
+        self.docs_by_city = docs_by_city
+        self.queries = []
+
+    def find(self, query, projection=None):
+        self.queries.append(query["city"])
+        return FakeCursor(self.docs_by_city.get(query["city"], []))
+
+
+class FakeContentFilter:
+    def precompute_embeddings(self, places):
+        pass
+
+    def get_embedding_matrix(self, places):
+        return np.zeros((len(places), 768), dtype=np.float32)
+
+
+class FakeRecommender:
+    content_filter = FakeContentFilter()
+
+
+class ItineraryQuery(BaseModel):
+    city: str
+    num_days: int
+    interests: list = []
+
+
+def place_docs(city: str, n: int = 3):
+    return [
+        {
+            "id": f"{city}_{i}",
+            "displayName": {"text": f"{city} place {i}"},
+            "city": city,
+            "types": ["tourist_attraction"],
+            "rating": 4.0,
+            "location": {"latitude": 21.0 + i * 0.01, "longitude": 105.8}
+        }
+        for i in range(n)
+    ]
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(response_cache.time, "monotonic", fake)
+    return fake
+
+
+def test_response_cache_key_ignores_field_order():
+    a = ItineraryQuery(city="Hanoi", num_days=3, interests=["food"])
+    b = ItineraryQuery(num_days=3, interests=["food"], city="Hanoi")
+    c = ItineraryQuery(city="Hanoi", num_days=4, interests=["food"])
+
+    assert ResponseCache.make_key(a) == ResponseCache.make_key(b)
+    assert ResponseCache.make_key(a) != ResponseCache.make_key(c)
+
+
+def test_response_cache_ttl(clock):
+    cache = ResponseCache(maxsize=4, ttl_seconds=60)
+    cache.set("k", "Hanoi", "response")
+
+    clock.now += 59
+    assert cache.get("k") == "response"
+
+    clock.now += 2
+    assert cache.get("k") is None
+    assert cache.invalidate() == 0  # expired entry was dropped on access
+
+
+def test_response_cache_lru_eviction(clock):
+    cache = ResponseCache(maxsize=2, ttl_seconds=60)
+    cache.set("a", "Hanoi", 1)
+    cache.set("b", "Hanoi", 2)
+
+    assert cache.get("a") == 1  # a is now most recently used
+    cache.set("c", "Hue", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_response_cache_invalidate(clock):
+    cache = ResponseCache(maxsize=8, ttl_seconds=60)
+    cache.set("a", "Hanoi", 1)
+    cache.set("b", "Hanoi", 2)
+    cache.set("c", "Hue", 3)
+
+    assert cache.invalidate("Hanoi") == 2
+    assert cache.get("a") is None and cache.get("b") is None
+    assert cache.get("c") == 3
+    assert cache.invalidate("Danang") == 0
+    assert cache.invalidate() == 1
+    assert cache.get("c") is None
+
+
+def test_city_cache_lru_eviction():
+    places = FakePlaces({city: place_docs(city) for city in ("Hanoi", "Hue", "Danang")})
+    db = {"places": places}
+    cache = CityCache(maxsize=2)
+
+    async def scenario():
+        await cache.get("Hanoi", db, FakeRecommender())
+        await cache.get("Hue", db, FakeRecommender())
+        await cache.get("Hanoi", db, FakeRecommender())  # hit, Hue is now oldest
+        await cache.get("Danang", db, FakeRecommender())  # evicts Hue
+        await cache.get("Hanoi", db, FakeRecommender())
+        await cache.get("Hue", db, FakeRecommender())
+
+    asyncio.run(scenario())
+
+    assert places.queries == ["Hanoi", "Hue", "Danang", "Hue"]
+
+
+def test_city_cache_loads_each_city_once():
+    places = FakePlaces({city: place_docs(city) for city in ("Hanoi", "Hue")})
+    db = {"places": places}
+    cache = CityCache(maxsize=4)
+
+    async def scenario():
+        return await asyncio.gather(
+            *(cache.get(city, db, FakeRecommender()) for city in ["Hanoi"] * 5 + ["Hue"] * 3)
+        )
+
+    results = asyncio.run(scenario())
+
+    # Concurrent misses on a city wait on its lock and share one load
+    assert sorted(places.queries) == ["Hanoi", "Hue"]
+    assert all(entry is results[0] for entry in results[:5])
+    assert len(results[0].places) == 3
+    assert results[0].embeddings.shape == (3, 768)
+    assert results[0].distance_matrix.shape == (3, 3)
+
+
+def test_city_cache_does_not_keep_empty_cities():
+    places = FakePlaces({})
+    db = {"places": places}
+    cache = CityCache(maxsize=4)
+
+    async def scenario():
+        first = await cache.get("Nowhere", db, FakeRecommender())
+        await cache.get("Nowhere", db, FakeRecommender())
+        return first
+
+    assert asyncio.run(scenario()).places == []
+    assert places.queries == ["Nowhere", "Nowhere"]
+    assert cache.invalidate("Nowhere") == 0
@@ -0,0 +1,140 @@
+"""
+Unit tests for the BERT embedding cache
+.npy/JSON persistence of the stacked float16 embedding matrix
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.content_filter_bert import ContentBasedFilterBERT
+from src.models import Place
+
+
+def unit_vectors(n: int, seed: int = 0) -> np.ndarray:
+    vectors = np.random.default_rng(seed).normal(size=(n, ContentBasedFilterBERT.EMBEDDING_DIM))
+    return (vectors / np.linalg.norm(vectors, axis=1, keepdims=True)).astype(np.float32)
+
+
+def filled_cache(cache_dir: Path, n: int = 5) -> ContentBasedFilterBERT:
+    content_filter = ContentBasedFilterBERT(cache_dir=str(cache_dir))
+    with content_filter._lock:
+        content_filter._append_rows([f"place_{i}" for i in range(n)], unit_vectors(n))
+    content_filter._save_cache()
+    return content_filter
+
+
+def test_save_load_round_trip(tmp_path):
+    saved = filled_cache(tmp_path)
+
+    loaded = ContentBasedFilterBERT(cache_dir=str(tmp_path))
+
+    assert list(loaded.embedding_cache) == list(saved.embedding_cache)
+    assert isinstance(loaded._emb_matrix, np.memmap)
+    for place_id in saved.embedding_cache:
+        np.testing.assert_array_equal(loaded.embedding_cache[place_id], saved.embedding_cache[place_id])
+
+    # float16 storage of unit vectors
+    np.testing.assert_allclose(
+        loaded.embedding_cache["place_0"].astype(np.float32), unit_vectors(5)[0], atol=1e-3
+    )
+
+
+def test_append_after_load_grows_matrix(tmp_path):
+    filled_cache(tmp_path, n=3)
+    content_filter = ContentBasedFilterBERT(cache_dir=str(tmp_path))
+
+    with content_filter._lock:
+        content_filter._append_rows(["place_new"], unit_vectors(1, seed=1))
+    content_filter._save_cache()
+
+    loaded = ContentBasedFilterBERT(cache_dir=str(tmp_path))
+    assert len(loaded.embedding_cache) == 4
+    np.testing.assert_allclose(
+        loaded.embedding_cache["place_new"].astype(np.float32), unit_vectors(1, seed=1)[0], atol=1e-3
+    )
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_mismatched_row_count_is_discarded(tmp_path):
+    saved = filled_cache(tmp_path)
+
+    # Ids of a newer save next to the matrix of an older one
+    meta = json.loads(saved.ids_file.read_text(encoding="utf-8"))
+    meta["ids"].append("place_extra")
+    meta["rows"] += 1
+    saved.ids_file.write_text(json.dumps(meta), encoding="utf-8")
+
+    assert len(ContentBasedFilterBERT(cache_dir=str(tmp_path)).embedding_cache) == 0
+
+
+def test_cache_from_other_encoder_is_ignored(tmp_path):
+    saved = filled_cache(tmp_path)
+
+    meta = json.loads(saved.ids_file.read_text(encoding="utf-8"))
+    meta["encoder"] = {**meta["encoder"], "backend": "other", "quantization": "none"}
+    saved.ids_file.write_text(json.dumps(meta), encoding="utf-8")
+
+    assert len(ContentBasedFilterBERT(cache_dir=str(tmp_path)).embedding_cache) == 0
+
+
+def test_clear_cache_removes_files(tmp_path):
+    content_filter = filled_cache(tmp_path)
+    content_filter.clear_cache()
+
+    assert len(content_filter.embedding_cache) == 0
+    assert not content_filter.cache_file.exists()
+    assert not content_filter.ids_file.exists()
+    with pytest.raises(KeyError):
+        content_filter.embedding_cache["place_0"]
+
+
+class LockCheckingModel:
+    """Encoder that records whether the filter's lock was held while encoding"""
+
+    def __init__(self, owner: ContentBasedFilterBERT):
+        self.owner = owner
+        self.locked_during_encode = []
+
+    def encode(self, texts, **kwargs):
+        self.locked_during_encode.append(self.owner._lock.locked())
+        single = isinstance(texts, str)
+        vectors = unit_vectors(1 if single else len(texts), seed=len(self.locked_during_encode))
+        return vectors[0] if single else vectors
+
+
+def test_encode_and_save_run_without_the_lock(tmp_path, monkeypatch):
+    content_filter = ContentBasedFilterBERT(cache_dir=str(tmp_path))
+    model = LockCheckingModel(content_filter)
+    content_filter.model = model
+    content_filter._model_loaded = True
+
+    locked_during_save = []
+    write_cache = content_filter._write_cache
+
+    def checking_write_cache(matrix, meta):
+        locked_during_save.append(content_filter._lock.locked())
+        write_cache(matrix, meta)
+
+    monkeypatch.setattr(content_filter, "_write_cache", checking_write_cache)
+
+    places = [
+        Place(place_id=f"place_{i}", name=f"Place {i}", city="Hanoi", types=["museum"],
+              rating=4.0, latitude=21.0, longitude=105.8)
+        for i in range(4)
+    ]
+    content_filter.precompute_embeddings(places + places[:1])
+    content_filter._create_place_embedding(
+        Place(place_id="single", name="Single", city="Hue", types=[], rating=4.0, latitude=16.4, longitude=107.6)
+    )
+
+    assert model.locked_during_encode == [False, False]
+    assert locked_during_save == [False]
+    assert list(content_filter.embedding_cache) == ["place_0", "place_1", "place_2", "place_3", "single"]
+    assert content_filter.get_embedding_matrix(places).shape == (4, ContentBasedFilterBERT.EMBEDDING_DIM)
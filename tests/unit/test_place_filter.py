@@ -0,0 +1,43 @@
+"""
+Unit tests for place filtering
+Type matching against block type sets and caller-supplied types
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.config import BlockType, TimeBlockConfig
+from src.models import Place
+from src.place_filter import PlaceFilter
+
+
+def make_place(place_id: str, types):
+    return Place(
+        place_id=place_id, name=place_id, city="Hanoi", types=types,
+        rating=4.0, latitude=21.0, longitude=105.8
+    )
+
+
+PLACES = [
+    make_place("museum", ["Museum", "point_of_interest"]),
+    make_place("cafe", ["cafe"]),
+    make_place("none", []),
+]
+
+
+def test_filter_by_block_type_set():
+    allowed = TimeBlockConfig.get_place_types_for_block(BlockType.MORNING)
+
+    assert [p.place_id for p in PlaceFilter.filter_by_types(PLACES, allowed)] == ["museum"]
+
+
+def test_filter_by_mixed_case_types():
+    for allowed in (["MUSEUM", "Cafe"], {"MUSEUM", "Cafe"}, frozenset({"MUSEUM", "Cafe"})):
+        assert [p.place_id for p in PlaceFilter.filter_by_types(PLACES, allowed)] == ["museum", "cafe"]
+
+
+def test_filter_by_no_types():
+    assert PlaceFilter.filter_by_types(PLACES, frozenset()) == []
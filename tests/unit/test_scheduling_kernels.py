@@ -0,0 +1,107 @@
+"""
+Unit tests for the block scheduling kernels
+Exact orderings (Heap's / Held-Karp), MST bound and best-first combinations
+"""
+
+import sys
+from itertools import combinations, permutations
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.block_scheduler import _combinations_by_score
+from src.scheduling_kernels import held_karp_order, min_travel_perm, mst_weight, path_travel
+
+
+def random_travel_matrix(rng: np.random.Generator, m: int) -> np.ndarray:
+    """Symmetric travel hours between m random points (zero diagonal)"""
+    points = rng.uniform(0.0, 10.0, size=(m, 2))
+    return np.linalg.norm(points[:, None, :] - points[None, :, :], axis=2) / 30.0
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_heaps_ordering_is_minimum_travel(seed):
+    rng = np.random.default_rng(seed)
+    m = 7
+    travel_time = random_travel_matrix(rng, m)
+    combo = rng.choice(m - 1, size=4, replace=False).astype(np.int64)
+    prev_idx = m - 1 if seed % 2 else -1
+
+    perm = min_travel_perm(combo, travel_time, prev_idx)
+    best = min(
+        path_travel(np.array(order, dtype=np.int64), travel_time, prev_idx)
+        for order in permutations(combo.tolist())
+    )
+
+    assert sorted(perm.tolist()) == sorted(combo.tolist())
+    assert path_travel(perm, travel_time, prev_idx) == pytest.approx(best)
+
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_held_karp_matches_exhaustive_order(seed):
+    rng = np.random.default_rng(seed)
+    m = 8
+    travel_time = random_travel_matrix(rng, m)
+    k = int(rng.integers(2, 7))
+    combo = rng.choice(m - 1, size=k, replace=False).astype(np.int64)
+    prev_idx = m - 1 if seed % 2 else -1
+
+    exhaustive = min_travel_perm(combo, travel_time, prev_idx)
+    dp = held_karp_order(combo, travel_time, prev_idx)
+
+    assert sorted(dp.tolist()) == sorted(combo.tolist())
+    assert path_travel(dp, travel_time, prev_idx) == pytest.approx(
+        path_travel(exhaustive, travel_time, prev_idx)
+    )
+
+
+def test_single_place_orderings():
+    travel_time = random_travel_matrix(np.random.default_rng(0), 3)
+    combo = np.array([1], dtype=np.int64)
+
+    assert held_karp_order(combo, travel_time, 0).tolist() == [1]
+    assert min_travel_perm(combo, travel_time, 0).tolist() == [1]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_mst_weight_bounds_best_path(seed):
+    rng = np.random.default_rng(seed)
+    m = 9
+    travel_time = random_travel_matrix(rng, m)
+    combo = rng.choice(m - 1, size=6, replace=False).astype(np.int64)
+    prev_idx = m - 1 if seed % 2 else -1
+
+    best = path_travel(held_karp_order(combo, travel_time, prev_idx), travel_time, prev_idx)
+
+    assert mst_weight(combo, travel_time, prev_idx) <= best + 1e-9
+
+
+def test_mst_weight_single_place():
+    travel_time = random_travel_matrix(np.random.default_rng(0), 3)
+    combo = np.array([1], dtype=np.int64)
+
+    assert mst_weight(combo, travel_time, -1) == 0.0
+    assert mst_weight(combo, travel_time, 0) == pytest.approx(travel_time[0, 1])
+
+@pytest.mark.parametrize("k", [1, 2, 3, 4])
+def test_combinations_by_score_descending(k):
+    rng = np.random.default_rng(k)
+    scores = np.sort(rng.uniform(0.0, 1.0, size=9))[::-1]
+
+    results = list(_combinations_by_score(scores, k))
+    sums = [score for score, _ in results]
+
+    # Non-increasing sums, each combination exactly once
+    assert all(a >= b - 1e-12 for a, b in zip(sums, sums[1:]))
+    assert sorted(combo for _, combo in results) == list(combinations(range(len(scores)), k))
+    for score, combo in results:
+        assert score == pytest.approx(scores[list(combo)].sum())
+
+
+def test_combinations_by_score_k_larger_than_n():
+    assert list(_combinations_by_score(np.array([0.9, 0.5]), 3)) == []